@@ -1,11 +1,11 @@
 import uuid
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from langchain.agents.agent import RunnableAgent
 from langchain.agents.format_scratchpad import format_log_to_str
 from langchain.memory import ConversationSummaryMemory
 from langchain.tools.render import render_text_description
 from langchain_core.runnables.config import RunnableConfig
-from langchain_openai import ChatOpenAI
 from pydantic import (
     UUID4,
     BaseModel,
@@ -22,10 +22,43 @@ from crewai.agents import (
     CacheHandler,
     CrewAgentExecutor,
     CrewAgentOutputParser,
+    PlanCache,
     ToolsHandler,
 )
 from crewai.utilities import I18N, Logger, Prompts, RPMController
 
+_default_clients: Optional[Tuple[Any, Any]] = None
+
+
+def _get_default_llm() -> Any:
+    """
+    Return a new default language model for an agent that isn't given one.
+
+    Each agent gets its own ChatOpenAI, so changing the settings of one doesn't
+    affect the others, but they all reuse the OpenAI clients of the first one.
+    That means one HTTP connection pool to OpenAI for the whole process, so agents
+    reuse open connections instead of each opening their own. The OpenAI client is
+    only imported here, agents given their own llm never load it.
+
+    Returns:
+        ChatOpenAI: The default language model.
+    """
+    global _default_clients
+    from langchain_openai import ChatOpenAI
+
+    if _default_clients is None:
+        llm = ChatOpenAI(temperature=0.7, model_name="gpt-4")
+        _default_clients = (llm.client, llm.async_client)
+        return llm
+
+    client, async_client = _default_clients
+    return ChatOpenAI(
+        temperature=0.7,
+        model_name="gpt-4",
+        client=client,
+        async_client=async_client,
+    )
+
 
 class Agent(BaseModel):
     """Represents an agent in a system.
@@ -39,7 +72,10 @@ class Agent(BaseModel):
             goal: The objective of the agent.
             backstory: The backstory of the agent.
             llm: The language model that will run the agent.
+            tool_llm: Optional smaller language model picking the tools, llm still writes the final answer.
             max_iter: Maximum number of iterations for an agent to execute a task.
+            context_budget_tokens: Maximum number of tokens of previous steps sent back to the llm.
+            plan_cache: Replays the tool actions of previous runs of the same task.
             memory: Whether the agent should have memory or not.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
@@ -50,6 +86,10 @@ class Agent(BaseModel):
     _logger: Logger = PrivateAttr()
     _rpm_controller: RPMController = PrivateAttr(default=None)
     _request_within_rpm_limit: Any = PrivateAttr(default=None)
+    # Token counts of the steps formatted last, by id, to count each step only once
+    _step_tokens: Dict[int, Tuple[Any, int]] = PrivateAttr(default_factory=dict)
+    # Whether cache_handler was given by the user, crews then don't replace it
+    _own_cache_handler: Optional[bool] = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     id: UUID4 = Field(
@@ -79,6 +119,14 @@ class Agent(BaseModel):
     max_iter: Optional[int] = Field(
         default=15, description="Maximum iterations for an agent to execute a task"
     )
+    context_budget_tokens: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens of previous steps sent back to the llm, the oldest ones are dropped first.",
+    )
+    plan_cache: Optional[InstanceOf[PlanCache]] = Field(
+        default=None,
+        description="Tool actions of previous runs, replayed from the tool cache when the same task is given the same tools again.",
+    )
     agent_executor: Optional[InstanceOf[CrewAgentExecutor]] = Field(
         default=None, description="An instance of the CrewAgentExecutor class."
     )
@@ -86,18 +134,20 @@ class Agent(BaseModel):
         default=None, description="An instance of the ToolsHandler class."
     )
     cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
-        default=CacheHandler(), description="An instance of the CacheHandler class."
+        default_factory=CacheHandler,
+        description="An instance of the CacheHandler class.",
     )
     i18n: Optional[I18N] = Field(
-        default=I18N(), description="Internationalization settings."
+        default_factory=I18N, description="Internationalization settings."
     )
     llm: Optional[Any] = Field(
-        default_factory=lambda: ChatOpenAI(
-            temperature=0.7,
-            model_name="gpt-4",
-        ),
+        default_factory=_get_default_llm,
         description="Language model that will run the agent.",
     )
+    tool_llm: Optional[Any] = Field(
+        default=None,
+        description="Language model picking the tools and their input, the final answer is still written by llm at the cost of one extra llm call per run.",
+    )
 
     @field_validator("id", mode="before")
     @classmethod
@@ -134,6 +184,10 @@ class Agent(BaseModel):
             <ReturnType>: <Description of the return value>
         """
         self._logger = Logger(self.verbose)
+        # Validators run again when the agent is given to a task or crew, by then
+        # cache_handler was set by set_cache_handler
+        if self._own_cache_handler is None:
+            self._own_cache_handler = "cache_handler" in self.model_fields_set
         if self.max_rpm and not self._rpm_controller:
             self._rpm_controller = RPMController(
                 max_rpm=self.max_rpm, logger=self._logger
@@ -171,21 +225,42 @@ class Agent(BaseModel):
             Raises:
                 Any exceptions that may occur during the task execution.
         """
-        if context:
-            task = self.i18n.slice("task_with_context").format(
-                task=task, context=context
-            )
+        inputs = self.__task_inputs(task, context, tools)
+        result = self.agent_executor.invoke(
+            inputs, RunnableConfig(callbacks=[self.tools_handler])
+        )["output"]
 
-        tools = tools or self.tools
-        self.agent_executor.tools = tools
+        if self.max_rpm:
+            self._rpm_controller.stop_rpm_counter()
 
-        result = self.agent_executor.invoke(
-            {
-                "input": task,
-                "tool_names": self.__tools_names(tools),
-                "tools": render_text_description(tools),
-            },
-            RunnableConfig(callbacks=[self.tools_handler]),
+        return result
+
+    async def aexecute_task(
+        self, task: str, context: str = None, tools: List[Any] = None
+    ) -> str:
+        """
+        Execute a task with the agent asynchronously.
+
+        Independent tasks can be awaited together, e.g. with `asyncio.gather`, as long
+        as they use the same tools since the executor's tools are set per call. Each
+        run counts its own iterations, so one doesn't force the answer of the others.
+
+        Args:
+            task (str): Task to execute.
+            context (str, optional): Context to execute the task in. Defaults to None.
+            tools (List[Any], optional): Tools to use for the task. Defaults to None.
+
+        Returns:
+            str: Output of the agent
+
+        Raises:
+            Any exceptions that may occur during the task execution.
+        """
+        inputs = self.__task_inputs(task, context, tools)
+        result = (
+            await self.agent_executor.ainvoke(
+                inputs, RunnableConfig(callbacks=[self.tools_handler])
+            )
         )["output"]
 
         if self.max_rpm:
@@ -193,6 +268,34 @@ class Agent(BaseModel):
 
         return result
 
+    def __task_inputs(
+        self, task: str, context: Optional[str], tools: Optional[List[Any]]
+    ) -> Dict[str, str]:
+        """
+        Build the executor inputs for a task and point the executor at its tools.
+
+        Args:
+            task (str): Task to execute.
+            context (str, optional): Context to execute the task in.
+            tools (List[Any], optional): Tools to use for the task, the agent's tools when not given.
+
+        Returns:
+            Dict[str, str]: The inputs of the executor.
+        """
+        if context:
+            task = self.i18n.slice("task_with_context").format(
+                task=task, context=context
+            )
+
+        tools = tools or self.tools
+        self.agent_executor.tools = tools
+
+        return {
+            "input": task,
+            "tool_names": self.__tools_names(tools),
+            "tools": render_text_description(tools),
+        }
+
     def set_cache_handler(self, cache_handler) -> None:
         """
         Set the cache handler for the current instance.
@@ -241,7 +344,9 @@ class Agent(BaseModel):
             "input": lambda x: x["input"],
             "tools": lambda x: x["tools"],
             "tool_names": lambda x: x["tool_names"],
-            "agent_scratchpad": lambda x: format_log_to_str(x["intermediate_steps"]),
+            "agent_scratchpad": lambda x: self._format_scratchpad(
+                x["intermediate_steps"]
+            ),
         }
         executor_args = {
             "i18n": self.i18n,
@@ -249,6 +354,8 @@ class Agent(BaseModel):
             "verbose": self.verbose,
             "handle_parsing_errors": True,
             "max_iterations": self.max_iter,
+            "plan_cache": self.plan_cache,
+            "cache_handler": self.cache_handler,
         }
 
         if self._rpm_controller:
@@ -272,19 +379,58 @@ class Agent(BaseModel):
             backstory=self.backstory,
         )
 
-        bind = self.llm.bind(stop=[self.i18n.slice("observation")])
+        output_parser = CrewAgentOutputParser(
+            tools_handler=self.tools_handler,
+            cache=self.cache_handler,
+            i18n=self.i18n,
+        )
+        stop = [self.i18n.slice("observation")]
         inner_agent = (
-            agent_args
-            | execution_prompt
-            | bind
-            | CrewAgentOutputParser(
-                tools_handler=self.tools_handler,
-                cache=self.cache_handler,
-                i18n=self.i18n,
-            )
+            agent_args | execution_prompt | self.llm.bind(stop=stop) | output_parser
         )
+        if self.tool_llm:
+            executor_args["tool_agent"] = RunnableAgent(
+                runnable=agent_args
+                | execution_prompt
+                | self.tool_llm.bind(stop=stop)
+                | output_parser
+            )
         self.agent_executor = CrewAgentExecutor(agent=inner_agent, **executor_args)
 
+    def _format_scratchpad(self, intermediate_steps) -> str:
+        """
+        Format the previous steps for the prompt, keeping only the latest ones that fit the context budget.
+
+        The most recent step is always kept so the agent sees its last observation. Steps
+        are the same objects from one call to the next during a run, so each one is only
+        tokenized once.
+
+        Args:
+            intermediate_steps (list): The (action, observation) pairs of the steps taken so far.
+
+        Returns:
+            str: The scratchpad to send to the llm.
+        """
+        budget = self.context_budget_tokens
+        if not budget:
+            return format_log_to_str(intermediate_steps)
+
+        counted = self._step_tokens
+        step_tokens = {}
+        kept = used = 0
+        for step in reversed(intermediate_steps):
+            entry = counted.get(id(step))
+            # The step is kept with its count, so a reused id can't match another one
+            if entry is None or entry[0] is not step:
+                entry = (step, self.llm.get_num_tokens(format_log_to_str([step])))
+            step_tokens[id(step)] = entry
+            used += entry[1]
+            if kept and used > budget:
+                break
+            kept += 1
+        self._step_tokens = step_tokens
+        return format_log_to_str(intermediate_steps[len(intermediate_steps) - kept :])
+
     @staticmethod
     def __tools_names(tools) -> str:
         """
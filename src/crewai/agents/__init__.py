@@ -1,4 +1,5 @@
 from .cache.cache_handler import CacheHandler
+from .cache.plan_cache import PlanCache
 from .executor import CrewAgentExecutor
 from .output_parser import CrewAgentOutputParser
 from .tools_handler import ToolsHandler
@@ -1,2 +1,3 @@
 from .cache_handler import CacheHandler
 from .cache_hit import CacheHit
+from .plan_cache import PlanCache
@@ -1,19 +1,23 @@
-from typing import Optional
+import sys
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
 
-from pydantic import PrivateAttr
+from .disk_cache import DiskCache
 
 
 class CacheHandler:
     """Callback handler for tool usage."""
 
-    _cache: PrivateAttr = {}
+    __slots__ = ("max_size", "_cache", "_normalizers", "_disk")
 
-    def __init__(self):
+    def __init__(self, max_size: int = 1024, path: Optional[str] = None):
         """
         Initialize the object.
 
         Args:
             self: The object itself.
+            max_size (int): Maximum number of tool results to keep, the least recently used ones are evicted first.
+            path (Optional[str]): SQLite file to also persist tool results to, so they are reused across runs.
 
         Returns:
             None
@@ -22,7 +26,38 @@ class CacheHandler:
             None
         """
 
-        self._cache = {}
+        self.max_size = max_size
+        self._cache = OrderedDict()
+        self._normalizers: Dict[str, Callable[[str], str]] = {}
+        self._disk = DiskCache(path) if path else None
+
+    def register_normalizer(self, tool: str, normalizer: Callable[[str], str]) -> None:
+        """
+        Register a function that rewrites a tool's input before it is used as a cache key.
+
+        Inputs that normalize to the same string share one cache entry, e.g. sorting
+        the arguments of a commutative tool so that "6,2" reuses the result of "2,6".
+
+        Args:
+            tool (str): The name of the tool.
+            normalizer (Callable[[str], str]): Maps a stripped input to its canonical form.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+
+        self._normalizers[sys.intern(tool)] = normalizer
+
+    def _key(self, tool, input):
+        """Return the cache key of a tool input, normalized if the tool registered a normalizer."""
+        input = input.strip()
+        normalizer = self._normalizers.get(tool)
+        if normalizer is not None:
+            input = normalizer(input)
+        return (sys.intern(tool), input)
 
     def add(self, tool, input, output):
         """
@@ -40,9 +75,10 @@ class CacheHandler:
         None
         """
 
-
-        input = input.strip()
-        self._cache[f"{tool}-{input}"] = output
+        key = self._key(tool, input)
+        self._remember(key, output)
+        if self._disk is not None:
+            self._disk.add(*key, output)
 
     def read(self, tool, input) -> Optional[str]:
         """
@@ -59,6 +95,33 @@ class CacheHandler:
             None
         """
 
-        
-        input = input.strip()
-        return self._cache.get(f"{tool}-{input}")
+        key = self._key(tool, input)
+        output = self._cache.get(key)
+        if output is not None:
+            self._cache.move_to_end(key)
+        elif self._disk is not None:
+            output = self._disk.read(*key)
+            if output is not None:
+                self._remember(key, output)
+        return output
+
+    def _remember(self, key, output):
+        """Keep an output in memory, evicting the least recently used one over max_size."""
+        self._cache[key] = output
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def __repr__(self) -> str:
+        """
+        Render the cached entries as "tool-input" keys, only when asked for.
+
+        Returns:
+            str: The representation of the cache handler.
+        """
+
+        entries = ", ".join(
+            f"{tool + '-' + input!r}: {output!r}"
+            for (tool, input), output in self._cache.items()
+        )
+        return f"{type(self).__name__}(max_size={self.max_size}, {{{entries}}})"
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any, ClassVar, Optional
+
+
+class DiskCache:
+    """Tool results persisted in a SQLite file, so they survive between runs."""
+
+    __slots__ = ("max_size", "_conn", "_lock")
+
+    # Entries are stamped with a counter rather than the time, so accesses within the
+    # clock's resolution, or the clock stepping back, don't evict the wrong entries.
+    _NEXT_STAMP: ClassVar[str] = "(SELECT COALESCE(MAX(used), 0) + 1 FROM tool_cache)"
+
+    def __init__(self, path: str, max_size: int = 10_000):
+        """
+        Open, or create, the cache file.
+
+        Args:
+            path (str): Path of the SQLite file holding the cache.
+            max_size (int): Maximum number of tool results to keep, the least recently used ones are evicted first.
+
+        Returns:
+            None
+
+        Raises:
+            sqlite3.Error: If the file can't be opened as a SQLite database.
+        """
+
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tool_cache "
+                "(key TEXT PRIMARY KEY, output TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS tool_cache_used ON tool_cache (used)"
+            )
+
+    @staticmethod
+    def key(tool: str, input: str) -> str:
+        """
+        Return the stable key of a tool input, the same in every process.
+
+        Args:
+            tool (str): The name of the tool.
+            input (str): The normalized input of the tool.
+
+        Returns:
+            str: The hex digest identifying the tool input.
+        """
+
+        # Length-prefixed so a tool name can't run into its input
+        payload = f"{len(tool)}:{tool}{input}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def add(self, tool: str, input: str, output: Any) -> None:
+        """
+        Store the output of a tool, evicting the least recently used entries over max_size.
+
+        Outputs that can't be serialized to JSON are not persisted.
+
+        Args:
+            tool (str): The name of the tool.
+            input (str): The normalized input of the tool.
+            output (Any): The output of the tool.
+
+        Returns:
+            None
+        """
+
+        try:
+            payload = json.dumps(output)
+        except (TypeError, ValueError):
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tool_cache (key, output, used) "
+                f"VALUES (?, ?, {self._NEXT_STAMP})",
+                (self.key(tool, input), payload),
+            )
+            # Walks the index, and deletes nothing until there are over max_size entries
+            self._conn.execute(
+                "DELETE FROM tool_cache WHERE used <= "
+                "(SELECT used FROM tool_cache ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                (self.max_size,),
+            )
+
+    def read(self, tool: str, input: str) -> Optional[Any]:
+        """
+        Read the stored output of a tool, marking it as recently used.
+
+        Args:
+            tool (str): The name of the tool.
+            input (str): The normalized input of the tool.
+
+        Returns:
+            Optional[Any]: The stored output, if any.
+        """
+
+        key = self.key(tool, input)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT output FROM tool_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                f"UPDATE tool_cache SET used = {self._NEXT_STAMP} WHERE key = ?", (key,)
+            )
+        return json.loads(row[0])
@@ -0,0 +1,79 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class PlanCache:
+    """Tool actions of previous successful runs, keyed by task and available tools."""
+
+    __slots__ = ("max_size", "_plans")
+
+    def __init__(self, max_size: int = 256):
+        """
+        Initialize the object.
+
+        Args:
+            max_size (int): Maximum number of plans to keep, the least recently used ones are evicted first.
+
+        Returns:
+            None
+        """
+
+        self.max_size = max_size
+        self._plans = OrderedDict()
+
+    @staticmethod
+    def _key(task: str, tool_names: Iterable[str]) -> Tuple[str, Tuple[str, ...]]:
+        """Return the plan key of a task, independent of the order of its tools."""
+        return (task, tuple(sorted(sys.intern(name) for name in tool_names)))
+
+    def add(self, task: str, tool_names: Iterable[str], actions: List[Any]) -> None:
+        """
+        Remember the tool actions a task was solved with.
+
+        Args:
+            task (str): The input of the task, context included.
+            tool_names (Iterable[str]): The names of the tools available to the task.
+            actions (List[Any]): The actions run before the final answer, in order.
+
+        Returns:
+            None
+        """
+
+        key = self._key(task, tool_names)
+        self._plans[key] = tuple(actions)
+        self._plans.move_to_end(key)
+        if len(self._plans) > self.max_size:
+            self._plans.popitem(last=False)
+
+    def read(self, task: str, tool_names: Iterable[str]) -> Optional[Tuple[Any, ...]]:
+        """
+        Read the tool actions a task was previously solved with.
+
+        Args:
+            task (str): The input of the task, context included.
+            tool_names (Iterable[str]): The names of the tools available to the task.
+
+        Returns:
+            Optional[Tuple[Any, ...]]: The actions to replay, if any.
+        """
+
+        key = self._key(task, tool_names)
+        actions = self._plans.get(key)
+        if actions is not None:
+            self._plans.move_to_end(key)
+        return actions
+
+    def discard(self, task: str, tool_names: Iterable[str]) -> None:
+        """
+        Forget the plan of a task, e.g. after it failed to replay.
+
+        Args:
+            task (str): The input of the task, context included.
+            tool_names (Iterable[str]): The names of the tools available to the task.
+
+        Returns:
+            None
+        """
+
+        self._plans.pop(self._key(task, tool_names), None)
@@ -1,13 +1,21 @@
+import asyncio
+import os
+import sys
 import time
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from langchain.agents import AgentExecutor
 from langchain.agents.agent import ExceptionTool
 from langchain.agents.tools import InvalidTool
-from langchain.callbacks.manager import CallbackManagerForChainRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import Callbacks
 from langchain_core.exceptions import OutputParserException
-from langchain_core.pydantic_v1 import root_validator
+from langchain_core.pydantic_v1 import Field, PrivateAttr, root_validator
 from langchain_core.tools import BaseTool
 from langchain_core.utils.input import get_color_mapping
 
@@ -15,13 +23,74 @@ from crewai.agents.cache.cache_hit import CacheHit
 from crewai.tools.cache_tools import CacheTools
 from crewai.utilities import I18N
 
+_make_cache_key = CacheTools.KEY_FORMAT.format
+
+
+def _finish_actions(executor, output, name_to_tool_map, color_mapping):
+    return None
+
+
+def _cache_hit_actions(executor, output, name_to_tool_map, color_mapping):
+    return [executor._cache_hit_action(output, name_to_tool_map, color_mapping)]
+
+
+def _single_action(executor, output, name_to_tool_map, color_mapping):
+    return [output]
+
+
+def _action_list(executor, output, name_to_tool_map, color_mapping):
+    return output
+
+
+class _RefusedObservation(str):
+    """Observation of an action refused to force the answer, its tool never ran."""
+
+    __slots__ = ()
+
+
+# Handlers turning a planned output into the actions to run, None meaning the
+# agent is done. Keyed on the exact type so most steps take a single lookup.
+_OUTPUT_HANDLERS = {
+    AgentFinish: _finish_actions,
+    CacheHit: _cache_hit_actions,
+    AgentAction: _single_action,
+    list: _action_list,
+}
+
+
+def _output_handler(output_type: type):
+    """Return the handler for an output type, resolving subclasses once through their MRO."""
+    handler = _OUTPUT_HANDLERS.get(output_type)
+    if handler is None:
+        handler = next(
+            (
+                _OUTPUT_HANDLERS[klass]
+                for klass in output_type.__mro__
+                if klass in _OUTPUT_HANDLERS
+            ),
+            _action_list,
+        )
+        _OUTPUT_HANDLERS[output_type] = handler
+    return handler
+
 
 class CrewAgentExecutor(AgentExecutor):
     i18n: I18N = I18N()
+    # Latest count of any run, each run keeps its own to force the answer
     iterations: int = 0
     request_within_rpm_limit: Any = None
     max_iterations: Optional[int] = 15
     force_answer_max_iterations: Optional[int] = None
+    tool_concurrency: int = Field(
+        default_factory=lambda: int(os.getenv("CREWAI_TOOL_CONCURRENCY", "1"))
+    )
+    tool_agent: Optional[Any] = None
+    plan_cache: Optional[Any] = None
+    cache_handler: Optional[Any] = None
+    _available_tool_names: Optional[Tuple[str, ...]] = PrivateAttr(default=None)
+    _prepared_steps: Optional[Tuple[list, int, list]] = PrivateAttr(default=None)
+    _tool_maps: Optional[Tuple[tuple, dict, dict]] = PrivateAttr(default=None)
+    _cache_tool: Optional[Tuple[Any, BaseTool]] = PrivateAttr(default=None)
 
     @root_validator()
     def set_force_answer_max_iterations(cls, values: Dict) -> Dict:
@@ -43,10 +112,13 @@ class CrewAgentExecutor(AgentExecutor):
         values["force_answer_max_iterations"] = values["max_iterations"] - 2
         return values
 
-    def _should_force_answer(self) -> bool:
+    def _should_force_answer(self, iterations: Optional[int] = None) -> bool:
         """
         Check if the answer should be forced based on the number of iterations.
 
+        Args:
+            iterations (Optional[int]): The iterations of the current run, `iterations` when not given.
+
         Returns:
             bool: True if the number of iterations is equal to force_answer_max_iterations, False otherwise.
 
@@ -55,7 +127,9 @@ class CrewAgentExecutor(AgentExecutor):
         """
 
 
-        return True if self.iterations == self.force_answer_max_iterations else False
+        if iterations is None:
+            iterations = self.iterations
+        return True if iterations == self.force_answer_max_iterations else False
 
     def _force_answer(self, output: AgentAction):
         """
@@ -73,7 +147,8 @@ class CrewAgentExecutor(AgentExecutor):
 
 
         return AgentStep(
-            action=output, observation=self.i18n.errors("used_too_many_tools")
+            action=output,
+            observation=_RefusedObservation(self.i18n.errors("used_too_many_tools")),
         )
 
     def _call(
@@ -95,19 +170,18 @@ class CrewAgentExecutor(AgentExecutor):
         Raises:
         - Any exceptions raised during the execution of the method.
         """
-        # Construct a mapping of tool name to tool for easy lookup
-        name_to_tool_map = {tool.name: tool for tool in self.tools}
-        # We construct a mapping from each tool to a color, used for logging.
-        color_mapping = get_color_mapping(
-            [tool.name for tool in self.tools], excluded_colors=["green", "red"]
+        # Mappings of tool name to tool and to a color, used for logging.
+        name_to_tool_map, color_mapping = self._tool_mappings()
+        intermediate_steps: List[Tuple[AgentAction, str]] = self._replay_plan(
+            inputs, name_to_tool_map, color_mapping, run_manager=run_manager
         )
-        intermediate_steps: List[Tuple[AgentAction, str]] = []
-        # Let's start tracking the number of iterations and time elapsed
-        self.iterations = 0
+        # Let's start tracking the number of iterations and time elapsed, per run
+        # so that concurrent runs on the same executor don't share the count
+        iterations = self.iterations = 0
         time_elapsed = 0.0
-        start_time = time.time()
+        start_time = time.monotonic()
         # We now enter the agent loop (until it returns something).
-        while self._should_continue(self.iterations, time_elapsed):
+        while self._should_continue(iterations, time_elapsed):
             if not self.request_within_rpm_limit or self.request_within_rpm_limit():
                 next_step_output = self._take_next_step(
                     name_to_tool_map,
@@ -115,8 +189,10 @@ class CrewAgentExecutor(AgentExecutor):
                     inputs,
                     intermediate_steps,
                     run_manager=run_manager,
+                    iterations=iterations,
                 )
                 if isinstance(next_step_output, AgentFinish):
+                    self._remember_plan(inputs, intermediate_steps)
                     return self._return(
                         next_step_output, intermediate_steps, run_manager=run_manager
                     )
@@ -130,13 +206,149 @@ class CrewAgentExecutor(AgentExecutor):
                         return self._return(
                             tool_return, intermediate_steps, run_manager=run_manager
                         )
-                self.iterations += 1
-                time_elapsed = time.time() - start_time
+                iterations += 1
+                self.iterations = iterations
+                time_elapsed = time.monotonic() - start_time
         output = self.agent.return_stopped_response(
             self.early_stopping_method, intermediate_steps, **inputs
         )
         return self._return(output, intermediate_steps, run_manager=run_manager)
 
+    async def _acall(
+        self,
+        inputs: Dict[str, str],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run text through and get agent response asynchronously.
+
+        Follows the same loop as `_call`, but the RPM limit check runs in a worker
+        thread so that waiting for the next minute doesn't block the event loop.
+
+        Args:
+        - inputs (Dict[str, str]): A dictionary of input data.
+        - run_manager (Optional[AsyncCallbackManagerForChainRun]): An optional callback manager for chain run.
+
+        Returns:
+        - Dict[str, Any]: A dictionary containing the agent response.
+
+        Raises:
+        - Any exceptions raised during the execution of the method.
+        """
+        name_to_tool_map, color_mapping = self._tool_mappings()
+        intermediate_steps: List[Tuple[AgentAction, str]] = await self._areplay_plan(
+            inputs, name_to_tool_map, color_mapping, run_manager=run_manager
+        )
+        iterations = self.iterations = 0
+        time_elapsed = 0.0
+        start_time = time.monotonic()
+        while self._should_continue(iterations, time_elapsed):
+            if not self.request_within_rpm_limit or await asyncio.to_thread(
+                self.request_within_rpm_limit
+            ):
+                next_step_output = await self._atake_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager=run_manager,
+                    iterations=iterations,
+                )
+                if isinstance(next_step_output, AgentFinish):
+                    self._remember_plan(inputs, intermediate_steps)
+                    return await self._areturn(
+                        next_step_output, intermediate_steps, run_manager=run_manager
+                    )
+
+                intermediate_steps.extend(next_step_output)
+                if len(next_step_output) == 1:
+                    next_step_action = next_step_output[0]
+                    tool_return = self._get_tool_return(next_step_action)
+                    if tool_return is not None:
+                        return await self._areturn(
+                            tool_return, intermediate_steps, run_manager=run_manager
+                        )
+                iterations += 1
+                self.iterations = iterations
+                time_elapsed = time.monotonic() - start_time
+        output = self.agent.return_stopped_response(
+            self.early_stopping_method, intermediate_steps, **inputs
+        )
+        return await self._areturn(output, intermediate_steps, run_manager=run_manager)
+
+    def _take_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+        iterations: Optional[int] = None,
+    ) -> Union[AgentFinish, List[Tuple[AgentAction, str]]]:
+        """
+        Take a single step, forcing the answer based on the iterations of the current run.
+
+        Args:
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            inputs (Dict[str, str]): Input data for the agent.
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+            run_manager (Optional[CallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+            iterations (Optional[int], optional): The iterations of the current run. Defaults to `iterations`.
+
+        Returns:
+            Union[AgentFinish, List[Tuple[AgentAction, str]]]: The final answer, or the steps taken.
+        """
+        return self._consume_next_step(
+            list(
+                self._iter_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager,
+                    iterations=iterations,
+                )
+            )
+        )
+
+    async def _atake_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+        iterations: Optional[int] = None,
+    ) -> Union[AgentFinish, List[Tuple[AgentAction, str]]]:
+        """
+        Asynchronously take a single step, forcing the answer based on the iterations of the current run.
+
+        Args:
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            inputs (Dict[str, str]): Input data for the agent.
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+            run_manager (Optional[AsyncCallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+            iterations (Optional[int], optional): The iterations of the current run. Defaults to `iterations`.
+
+        Returns:
+            Union[AgentFinish, List[Tuple[AgentAction, str]]]: The final answer, or the steps taken.
+        """
+        return self._consume_next_step(
+            [
+                a
+                async for a in self._aiter_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager,
+                    iterations=iterations,
+                )
+            ]
+        )
+
     def _iter_next_step(
         self,
         name_to_tool_map: Dict[str, BaseTool],
@@ -144,6 +356,7 @@ class CrewAgentExecutor(AgentExecutor):
         inputs: Dict[str, str],
         intermediate_steps: List[Tuple[AgentAction, str]],
         run_manager: Optional[CallbackManagerForChainRun] = None,
+        iterations: Optional[int] = None,
     ) -> Iterator[Union[AgentFinish, AgentAction, AgentStep]]:
         
         """        Take a single step in the thought-action-observation loop.
@@ -156,6 +369,7 @@ class CrewAgentExecutor(AgentExecutor):
                 inputs (Dict[str, str]): Input data for the agent.
                 intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
                 run_manager (Optional[CallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+                iterations (Optional[int], optional): The iterations of the current run. Defaults to `iterations`.
 
             Yields:
                 Iterator[Union[AgentFinish, AgentAction, AgentStep]]: Yields AgentFinish, AgentAction, or AgentStep objects.
@@ -168,12 +382,12 @@ class CrewAgentExecutor(AgentExecutor):
             intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
 
             # Call the LLM to see what to do.
-            output = self.agent.plan(
+            output = self._plan(
                 intermediate_steps,
                 callbacks=run_manager.get_child() if run_manager else None,
                 **inputs,
             )
-            if self._should_force_answer():
+            if self._should_force_answer(iterations):
                 if isinstance(output, AgentAction):
                     output = output
                 else:
@@ -182,31 +396,7 @@ class CrewAgentExecutor(AgentExecutor):
                 return
 
         except OutputParserException as e:
-            if isinstance(self.handle_parsing_errors, bool):
-                raise_error = not self.handle_parsing_errors
-            else:
-                raise_error = False
-            if raise_error:
-                raise ValueError(
-                    "An output parsing error occurred. "
-                    "In order to pass this error back to the agent and have it try "
-                    "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
-                    f"This is the error: {str(e)}"
-                )
-            text = str(e)
-            if isinstance(self.handle_parsing_errors, bool):
-                if e.send_to_llm:
-                    observation = str(e.observation)
-                    text = str(e.llm_output)
-                else:
-                    observation = "Invalid or incomplete response"
-            elif isinstance(self.handle_parsing_errors, str):
-                observation = self.handle_parsing_errors
-            elif callable(self.handle_parsing_errors):
-                observation = self.handle_parsing_errors(e)
-            else:
-                raise ValueError("Got unexpected type of `handle_parsing_errors`")
-            output = AgentAction("_Exception", observation, text)
+            output = self._parsing_error_action(e)
             if run_manager:
                 run_manager.on_agent_action(output, color="green")
             tool_run_kwargs = self.agent.tool_run_logging_kwargs()
@@ -218,61 +408,666 @@ class CrewAgentExecutor(AgentExecutor):
                 **tool_run_kwargs,
             )
 
-            if self._should_force_answer():
+            if self._should_force_answer(iterations):
                 yield self._force_answer(output)
                 return
 
             yield AgentStep(action=output, observation=observation)
             return
 
-        # If the tool chosen is the finishing tool, then we end and return.
-        if isinstance(output, AgentFinish):
+        # Cache hits are overridden to use CacheTools, a finish ends the run.
+        actions: Optional[List[AgentAction]] = _output_handler(type(output))(
+            self, output, name_to_tool_map, color_mapping
+        )
+        if actions is None:
             yield output
             return
 
-        # Override tool usage to use CacheTools
-        if isinstance(output, CacheHit):
-            cache = output.cache
-            action = output.action
-            tool = CacheTools(cache_handler=cache).tool()
-            output = action.copy()
-            output.tool_input = f"tool:{action.tool}|input:{action.tool_input}"
-            output.tool = tool.name
-            name_to_tool_map[tool.name] = tool
-            color_mapping[tool.name] = color_mapping[action.tool]
-
-        actions: List[AgentAction]
-        actions = [output] if isinstance(output, AgentAction) else output
         yield from actions
+
+        # Both are invariant across the actions of a step
+        callbacks = run_manager.get_child() if run_manager else None
+        tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+
+        # Independent actions from the same step can overlap when opted in
+        # through `tool_concurrency`, tools are then expected to be thread-safe.
+        if len(actions) > 1 and self.tool_concurrency > 1:
+            if run_manager:
+                for agent_action in actions:
+                    run_manager.on_agent_action(agent_action, color="green")
+            # Scoped to the step, so no worker threads outlive it
+            with ThreadPoolExecutor(
+                max_workers=min(self.tool_concurrency, len(actions))
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        self._safe_run_tool,
+                        agent_action,
+                        name_to_tool_map,
+                        color_mapping,
+                        tool_run_kwargs,
+                        callbacks,
+                    )
+                    for agent_action in actions
+                ]
+                observations = [future.result() for future in futures]
+            for agent_action, observation in zip(actions, observations):
+                yield AgentStep(action=agent_action, observation=observation)
+            return
+
         for agent_action in actions:
             if run_manager:
                 run_manager.on_agent_action(agent_action, color="green")
-            # Otherwise we lookup the tool
-            if agent_action.tool in name_to_tool_map:
-                tool = name_to_tool_map[agent_action.tool]
-                return_direct = tool.return_direct
-                color = color_mapping[agent_action.tool]
-                tool_run_kwargs = self.agent.tool_run_logging_kwargs()
-                if return_direct:
-                    tool_run_kwargs["llm_prefix"] = ""
-                # We then call the tool on the tool input to get an observation
-                observation = tool.run(
-                    agent_action.tool_input,
-                    verbose=self.verbose,
-                    color=color,
-                    callbacks=run_manager.get_child() if run_manager else None,
-                    **tool_run_kwargs,
+            observation = self._run_tool(
+                agent_action,
+                name_to_tool_map,
+                color_mapping,
+                tool_run_kwargs,
+                callbacks,
+            )
+            yield AgentStep(action=agent_action, observation=observation)
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+        iterations: Optional[int] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        """
+        Take a single step in the thought-action-observation loop asynchronously.
+
+        Plans with `aplan` and runs the tools of the step one at a time, or up to
+        `tool_concurrency` of them together with `asyncio.gather` when opted in.
+
+        Args:
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            inputs (Dict[str, str]): Input data for the agent.
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+            run_manager (Optional[AsyncCallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+            iterations (Optional[int], optional): The iterations of the current run. Defaults to `iterations`.
+
+        Yields:
+            AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]: Yields AgentFinish, AgentAction, or AgentStep objects.
+
+        Raises:
+            ValueError: If an output parsing error occurs and `handle_parsing_errors` is set to False.
+        """
+        try:
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+
+            output = await self._aplan(
+                intermediate_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
+            )
+            if self._should_force_answer(iterations):
+                if not isinstance(output, AgentAction):
+                    output = output.action
+                yield self._force_answer(output)
+                return
+
+        except OutputParserException as e:
+            output = self._parsing_error_action(e)
+            if run_manager:
+                await run_manager.on_agent_action(output, color="green")
+            tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+            observation = await ExceptionTool().arun(
+                output.tool_input,
+                verbose=self.verbose,
+                color=None,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **tool_run_kwargs,
+            )
+
+            if self._should_force_answer(iterations):
+                yield self._force_answer(output)
+                return
+
+            yield AgentStep(action=output, observation=observation)
+            return
+
+        actions: Optional[List[AgentAction]] = _output_handler(type(output))(
+            self, output, name_to_tool_map, color_mapping
+        )
+        if actions is None:
+            yield output
+            return
+
+        for agent_action in actions:
+            yield agent_action
+
+        if run_manager:
+            for agent_action in actions:
+                await run_manager.on_agent_action(agent_action, color="green")
+        callbacks = run_manager.get_child() if run_manager else None
+        tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+
+        # Same opt-in as the sync path, at most `tool_concurrency` tools at once
+        if len(actions) > 1 and self.tool_concurrency > 1:
+            semaphore = asyncio.Semaphore(self.tool_concurrency)
+
+            async def run_tool(agent_action: AgentAction) -> str:
+                async with semaphore:
+                    return await self._arun_tool(
+                        agent_action,
+                        name_to_tool_map,
+                        color_mapping,
+                        tool_run_kwargs,
+                        callbacks,
+                    )
+
+            observations = await asyncio.gather(
+                *[run_tool(agent_action) for agent_action in actions]
+            )
+            for agent_action, observation in zip(actions, observations):
+                yield AgentStep(action=agent_action, observation=observation)
+            return
+
+        for agent_action in actions:
+            observation = await self._arun_tool(
+                agent_action,
+                name_to_tool_map,
+                color_mapping,
+                tool_run_kwargs,
+                callbacks,
+            )
+            yield AgentStep(action=agent_action, observation=observation)
+
+    def _plan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks = None,
+        **inputs: Any,
+    ) -> Union[AgentAction, AgentFinish, CacheHit]:
+        """
+        Ask the LLM what to do next, picking tools with `tool_agent` when there is one.
+
+        When `tool_agent` is done, `agent` is asked to write the final answer instead,
+        which costs one extra call of the main model per run. A tool it picks on that
+        call is ignored and the final answer of `tool_agent` kept, so tools are only
+        ever chosen by the smaller model.
+
+        Args:
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+            callbacks (Callbacks, optional): Child callbacks of the chain run. Defaults to None.
+            **inputs (Any): Input data for the agent.
+
+        Returns:
+            Union[AgentAction, AgentFinish, CacheHit]: The next action, or the final answer.
+        """
+        if self.tool_agent is None:
+            return self.agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+
+        output = self.tool_agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+        if not isinstance(output, AgentFinish):
+            return output
+        answer = self.agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+        return answer if isinstance(answer, AgentFinish) else output
+
+    async def _aplan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks = None,
+        **inputs: Any,
+    ) -> Union[AgentAction, AgentFinish, CacheHit]:
+        """
+        Asynchronously ask the LLM what to do next, picking tools with `tool_agent` when there is one.
+
+        Same as `_plan`, tools picked by `agent` for the final answer are ignored.
+
+        Args:
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+            callbacks (Callbacks, optional): Child callbacks of the chain run. Defaults to None.
+            **inputs (Any): Input data for the agent.
+
+        Returns:
+            Union[AgentAction, AgentFinish, CacheHit]: The next action, or the final answer.
+        """
+        if self.tool_agent is None:
+            return await self.agent.aplan(
+                intermediate_steps, callbacks=callbacks, **inputs
+            )
+
+        output = await self.tool_agent.aplan(
+            intermediate_steps, callbacks=callbacks, **inputs
+        )
+        if not isinstance(output, AgentFinish):
+            return output
+        answer = await self.agent.aplan(
+            intermediate_steps, callbacks=callbacks, **inputs
+        )
+        return answer if isinstance(answer, AgentFinish) else output
+
+    def _replay_plan(
+        self,
+        inputs: Dict[str, str],
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> List[Tuple[AgentAction, str]]:
+        """
+        Replay the tool actions a previous run solved the same task with, without planning them.
+
+        Only results still held by the cache are replayed, so no tool runs again before the
+        LLM chose it. The LLM then starts from the replayed steps, usually answering right
+        away. The plan is forgotten if a step fails, keeping the steps replayed until then.
+
+        Args:
+            inputs (Dict[str, str]): Input data for the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            run_manager (Optional[CallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+
+        Returns:
+            List[Tuple[AgentAction, str]]: The replayed steps, empty when there is no plan.
+        """
+        actions = self._planned_actions(inputs, name_to_tool_map, color_mapping)
+        if not actions:
+            return []
+
+        callbacks = run_manager.get_child() if run_manager else None
+        tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+        steps = []
+        try:
+            for agent_action in actions:
+                if run_manager:
+                    run_manager.on_agent_action(agent_action, color="green")
+                observation = self._run_tool(
+                    agent_action,
+                    name_to_tool_map,
+                    color_mapping,
+                    tool_run_kwargs,
+                    callbacks,
                 )
-            else:
-                tool_run_kwargs = self.agent.tool_run_logging_kwargs()
-                observation = InvalidTool().run(
-                    {
-                        "requested_tool_name": agent_action.tool,
-                        "available_tool_names": list(name_to_tool_map.keys()),
-                    },
-                    verbose=self.verbose,
-                    color=None,
-                    callbacks=run_manager.get_child() if run_manager else None,
-                    **tool_run_kwargs,
+                steps.append((agent_action, observation))
+        except Exception:
+            self.plan_cache.discard(inputs["input"], self._available_tool_names)
+        return steps
+
+    async def _areplay_plan(
+        self,
+        inputs: Dict[str, str],
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> List[Tuple[AgentAction, str]]:
+        """
+        Asynchronously replay the tool actions a previous run solved the same task with.
+
+        Args:
+            inputs (Dict[str, str]): Input data for the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            run_manager (Optional[AsyncCallbackManagerForChainRun], optional): Callback manager for chain run. Defaults to None.
+
+        Returns:
+            List[Tuple[AgentAction, str]]: The replayed steps, empty when there is no plan.
+        """
+        actions = self._planned_actions(inputs, name_to_tool_map, color_mapping)
+        if not actions:
+            return []
+
+        callbacks = run_manager.get_child() if run_manager else None
+        tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+        steps = []
+        try:
+            for agent_action in actions:
+                if run_manager:
+                    await run_manager.on_agent_action(agent_action, color="green")
+                observation = await self._arun_tool(
+                    agent_action,
+                    name_to_tool_map,
+                    color_mapping,
+                    tool_run_kwargs,
+                    callbacks,
                 )
-            yield AgentStep(action=agent_action, observation=observation)
+                steps.append((agent_action, observation))
+        except Exception:
+            self.plan_cache.discard(inputs["input"], self._available_tool_names)
+        return steps
+
+    def _planned_actions(
+        self,
+        inputs: Dict[str, str],
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+    ) -> List[AgentAction]:
+        """
+        Return the actions to replay for a task, as reads from the cache.
+
+        The plan is replayed up to its first action whose result the cache no longer holds,
+        since the following ones may depend on it.
+
+        Args:
+            inputs (Dict[str, str]): Input data for the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+
+        Returns:
+            List[AgentAction]: The actions to run, empty when there is no plan.
+        """
+        if self.plan_cache is None:
+            return []
+        plan = self.plan_cache.read(inputs["input"], self._available_tool_names)
+        if not plan:
+            return []
+
+        cache = self.cache_handler
+        if cache is None:
+            return []
+        actions = []
+        for agent_action in plan:
+            if cache.read(agent_action.tool, agent_action.tool_input) is None:
+                break
+            actions.append(
+                self._cache_hit_action(
+                    CacheHit(action=agent_action, cache=cache),
+                    name_to_tool_map,
+                    color_mapping,
+                )
+            )
+        return actions
+
+    def _remember_plan(
+        self, inputs: Dict[str, str], intermediate_steps: List[Tuple[AgentAction, str]]
+    ) -> None:
+        """
+        Remember the tool actions of a run that reached a final answer, to replay them next time.
+
+        Runs that went through a parsing error or an invalid tool aren't remembered, and
+        actions refused to force the answer are left out since their tool never ran.
+
+        Args:
+            inputs (Dict[str, str]): Input data for the agent.
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+
+        Returns:
+            None
+        """
+        if self.plan_cache is None or not intermediate_steps:
+            return
+
+        cache_tool_name = self._cache_tool[1].name if self._cache_tool else None
+        actions = []
+        for agent_action, observation in intermediate_steps:
+            if isinstance(observation, _RefusedObservation):
+                continue
+            if agent_action.tool == cache_tool_name:
+                # Replayed as the original tool, the cache may not hold it anymore
+                tool, tool_input = CacheTools.parse_key(agent_action.tool_input)
+                agent_action = AgentAction(tool, tool_input, agent_action.log)
+            elif agent_action.tool not in self._available_tool_names:
+                return
+            actions.append(agent_action)
+        self.plan_cache.add(inputs["input"], self._available_tool_names, actions)
+
+    def _tool_mappings(self) -> Tuple[Dict[str, BaseTool], Dict[str, str]]:
+        """
+        Return the tool name to tool and tool name to color mappings for the current tools.
+
+        They are only rebuilt when `tools` changes, either reassigned or mutated in place.
+        Copies are returned since a cache hit registers the cache tool for a single run.
+
+        Returns:
+            Tuple[Dict[str, BaseTool], Dict[str, str]]: The name to tool and name to color mappings.
+        """
+        tools = tuple(self.tools)
+        if self._tool_maps is None or self._tool_maps[0] != tools:
+            # Tool names are interned so the per-step lookups compare by identity
+            tool_names = [sys.intern(tool.name) for tool in tools]
+            self._tool_maps = (
+                tools,
+                dict(zip(tool_names, tools)),
+                get_color_mapping(tool_names, excluded_colors=["green", "red"]),
+            )
+            self._available_tool_names = tuple(tool_names)
+
+        _, name_to_tool_map, color_mapping = self._tool_maps
+        return dict(name_to_tool_map), dict(color_mapping)
+
+    def _prepare_intermediate_steps(
+        self, intermediate_steps: List[Tuple[AgentAction, str]]
+    ) -> List[Tuple[AgentAction, str]]:
+        """
+        Prepare the intermediate steps sent to the LLM, reusing the last result when unchanged.
+
+        Steps are only ever appended to during a run, so the same list with the same
+        length always prepares to the same value.
+
+        Args:
+            intermediate_steps (List[Tuple[AgentAction, str]]): List of intermediate steps as tuples of AgentAction and string.
+
+        Returns:
+            List[Tuple[AgentAction, str]]: The intermediate steps to plan with.
+        """
+        cached = self._prepared_steps
+        if (
+            cached is not None
+            and cached[0] is intermediate_steps
+            and cached[1] == len(intermediate_steps)
+        ):
+            return cached[2]
+
+        prepared = super()._prepare_intermediate_steps(intermediate_steps)
+        self._prepared_steps = (intermediate_steps, len(intermediate_steps), prepared)
+        return prepared
+
+    def _parsing_error_action(self, e: OutputParserException) -> AgentAction:
+        """
+        Turn an output parsing error into an action for the ExceptionTool.
+
+        Args:
+            e (OutputParserException): The error raised while parsing the LLM output.
+
+        Returns:
+            AgentAction: The `_Exception` action carrying the observation to send back to the LLM.
+
+        Raises:
+            ValueError: If `handle_parsing_errors` is set to False or has an unexpected type.
+        """
+        if isinstance(self.handle_parsing_errors, bool):
+            raise_error = not self.handle_parsing_errors
+        else:
+            raise_error = False
+        if raise_error:
+            raise ValueError(
+                "An output parsing error occurred. "
+                "In order to pass this error back to the agent and have it try "
+                "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
+                f"This is the error: {str(e)}"
+            )
+        text = str(e)
+        if isinstance(self.handle_parsing_errors, bool):
+            if e.send_to_llm:
+                observation = str(e.observation)
+                text = str(e.llm_output)
+            else:
+                observation = "Invalid or incomplete response"
+        elif isinstance(self.handle_parsing_errors, str):
+            observation = self.handle_parsing_errors
+        elif callable(self.handle_parsing_errors):
+            observation = self.handle_parsing_errors(e)
+        else:
+            raise ValueError("Got unexpected type of `handle_parsing_errors`")
+        return AgentAction("_Exception", observation, text)
+
+    def _cache_hit_action(
+        self,
+        output: CacheHit,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+    ) -> AgentAction:
+        """
+        Rewrite a cache hit into an action that reads from the cache tool.
+
+        Args:
+            output (CacheHit): The cache hit returned by the output parser.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+
+        Returns:
+            AgentAction: The action targeting the cache tool.
+        """
+        cache = output.cache
+        action = output.action
+        # The cache tool only depends on the cache handler, so it's built once per handler
+        if self._cache_tool is None or self._cache_tool[0] is not cache:
+            self._cache_tool = (cache, CacheTools(cache_handler=cache).tool())
+        tool = self._cache_tool[1]
+        cache_action = action.copy()
+        cache_action.tool_input = _make_cache_key(action.tool, action.tool_input)
+        cache_action.tool = tool.name
+        name_to_tool_map[tool.name] = tool
+        color_mapping[tool.name] = color_mapping[action.tool]
+        return cache_action
+
+    def _run_tool(
+        self,
+        agent_action: AgentAction,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        tool_run_kwargs: Dict[str, Any],
+        callbacks: Callbacks = None,
+    ) -> str:
+        """
+        Run the tool requested by an agent action and return its observation.
+
+        Args:
+            agent_action (AgentAction): The action picked by the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            tool_run_kwargs (Dict[str, Any]): Logging kwargs of the agent, shared by the tools of a step.
+            callbacks (Callbacks, optional): Child callbacks of the chain run. Defaults to None.
+
+        Returns:
+            str: The observation produced by the tool.
+        """
+        tool_name = sys.intern(agent_action.tool)
+        if tool_name in name_to_tool_map:
+            tool = name_to_tool_map[tool_name]
+            return_direct = tool.return_direct
+            color = color_mapping[tool_name]
+            if return_direct:
+                tool_run_kwargs = {**tool_run_kwargs, "llm_prefix": ""}
+            # We then call the tool on the tool input to get an observation
+            return tool.run(
+                agent_action.tool_input,
+                verbose=self.verbose,
+                color=color,
+                callbacks=callbacks,
+                **tool_run_kwargs,
+            )
+
+        return InvalidTool().run(
+            {
+                "requested_tool_name": agent_action.tool,
+                "available_tool_names": self._tool_names_for(name_to_tool_map),
+            },
+            verbose=self.verbose,
+            color=None,
+            callbacks=callbacks,
+            **tool_run_kwargs,
+        )
+
+    async def _arun_tool(
+        self,
+        agent_action: AgentAction,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        tool_run_kwargs: Dict[str, Any],
+        callbacks: Callbacks = None,
+    ) -> str:
+        """
+        Asynchronously run the tool requested by an agent action and return its observation.
+
+        Args:
+            agent_action (AgentAction): The action picked by the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            tool_run_kwargs (Dict[str, Any]): Logging kwargs of the agent, shared by the tools of a step.
+            callbacks (Callbacks, optional): Child callbacks of the chain run. Defaults to None.
+
+        Returns:
+            str: The observation produced by the tool.
+        """
+        tool_name = sys.intern(agent_action.tool)
+        if tool_name in name_to_tool_map:
+            tool = name_to_tool_map[tool_name]
+            return_direct = tool.return_direct
+            color = color_mapping[tool_name]
+            if return_direct:
+                tool_run_kwargs = {**tool_run_kwargs, "llm_prefix": ""}
+            return await tool.arun(
+                agent_action.tool_input,
+                verbose=self.verbose,
+                color=color,
+                callbacks=callbacks,
+                **tool_run_kwargs,
+            )
+
+        return await InvalidTool().arun(
+            {
+                "requested_tool_name": agent_action.tool,
+                "available_tool_names": self._tool_names_for(name_to_tool_map),
+            },
+            verbose=self.verbose,
+            color=None,
+            callbacks=callbacks,
+            **tool_run_kwargs,
+        )
+
+    def _tool_names_for(self, name_to_tool_map: Dict[str, BaseTool]) -> Tuple[str, ...]:
+        """
+        Return the tool names to report when the agent asks for an invalid tool.
+
+        The names are computed once per run in `_call`, falling back to the given mapping
+        when a step is taken outside of it.
+
+        Args:
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+
+        Returns:
+            Tuple[str, ...]: The names of the available tools.
+        """
+        if self._available_tool_names is None:
+            return tuple(name_to_tool_map)
+        return self._available_tool_names
+
+    def _safe_run_tool(
+        self,
+        agent_action: AgentAction,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        tool_run_kwargs: Dict[str, Any],
+        callbacks: Callbacks = None,
+    ) -> str:
+        """
+        Run a tool from the thread pool, turning any failure into an observation.
+
+        A failing tool shouldn't take down the other tool calls dispatched in the same step,
+        so the error is reported back to the agent instead of being raised.
+
+        Args:
+            agent_action (AgentAction): The action picked by the agent.
+            name_to_tool_map (Dict[str, BaseTool]): Mapping of tool names to their corresponding BaseTool instances.
+            color_mapping (Dict[str, str]): Mapping of tool names to their corresponding colors.
+            tool_run_kwargs (Dict[str, Any]): Logging kwargs of the agent, shared by the tools of a step.
+            callbacks (Callbacks, optional): Child callbacks of the chain run. Defaults to None.
+
+        Returns:
+            str: The observation produced by the tool, or the error message if it failed.
+        """
+        try:
+            return self._run_tool(
+                agent_action,
+                name_to_tool_map,
+                color_mapping,
+                tool_run_kwargs,
+                callbacks,
+            )
+        except Exception as e:
+            return self.i18n.errors("tool_usage_error").format(error=e)
@@ -13,6 +13,10 @@ FINAL_ANSWER_ACTION = "Final Answer:"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = (
     "Parsing LLM output produced both a final answer and a parse-able action:"
 )
+# Compiled once, parse runs on every LLM output.
+_ACTION_RE = re.compile(
+    r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)", re.DOTALL
+)
 
 
 class CrewAgentOutputParser(ReActSingleInputOutputParser):
@@ -63,29 +67,20 @@ class CrewAgentOutputParser(ReActSingleInputOutputParser):
         - TaskRepeatedUsageException: If the tool usage is repeated.
         """
 
-        
-        FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        if action_match := re.search(regex, text, re.DOTALL):
+        if action_match := _ACTION_RE.search(text):
             action = action_match.group(1).strip()
             action_input = action_match.group(2)
             tool_input = action_input.strip(" ")
             tool_input = tool_input.strip('"')
 
-            if last_tool_usage := self.tools_handler.last_used_tool:
-                usage = {
-                    "tool": action,
-                    "input": tool_input,
-                }
-                if usage == last_tool_usage:
-                    raise TaskRepeatedUsageException(
-                        text=text,
-                        tool=action,
-                        tool_input=tool_input,
-                        i18n=self.i18n,
-                    )
+            last_tool_usage = self.tools_handler.last_used_tool
+            if last_tool_usage.tool == action and last_tool_usage.input == tool_input:
+                raise TaskRepeatedUsageException(
+                    text=text,
+                    tool=action,
+                    tool_input=tool_input,
+                    i18n=self.i18n,
+                )
 
             if self.cache.read(action, tool_input):
                 action = AgentAction(action, tool_input, text)
@@ -1,19 +1,84 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from uuid import UUID
 
 from langchain.callbacks.base import BaseCallbackHandler
 
 from ..tools.cache_tools import CacheTools
 from .cache.cache_handler import CacheHandler
 
+# Read through the class, building CacheTools would also build a default CacheHandler.
+_CACHE_TOOL_NAME = CacheTools.model_fields["name"].default
+
+
+class ToolUse:
+    """A tool and the input it was used with, empty until a tool is used."""
+
+    __slots__ = ("tool", "input")
+
+    def __init__(self, tool: Optional[str] = None, input: Optional[str] = None):
+        """
+        Initialize the tool use.
+
+        Args:
+            tool (Optional[str]): The name of the tool, None when no tool was used.
+            input (Optional[str]): The input the tool was used with.
+
+        Returns:
+            None
+        """
+        self.tool = tool
+        self.input = input
+
+    def __bool__(self) -> bool:
+        """
+        Tell whether a tool was used.
+
+        Returns:
+            bool: True once a tool was used, False for the empty tool use.
+        """
+        return self.tool is not None
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Compare with another tool use, or with its {"tool": ..., "input": ...} dict form.
+
+        Returns:
+            bool: Whether both describe the same tool use.
+        """
+        if isinstance(other, ToolUse):
+            return self.tool == other.tool and self.input == other.input
+        if isinstance(other, dict):
+            return other == self.as_dict()
+        return NotImplemented
+
+    def as_dict(self) -> Dict[str, str]:
+        """
+        Return the tool use as a dict, empty when no tool was used.
+
+        Returns:
+            Dict[str, str]: The "tool" and "input" of the tool use.
+        """
+        if not self:
+            return {}
+        return {"tool": self.tool, "input": self.input}
+
+    def __repr__(self) -> str:
+        """
+        Return a representation showing the tool and its input.
+
+        Returns:
+            str: The representation of the tool use.
+        """
+        return f"{type(self).__name__}(tool={self.tool!r}, input={self.input!r})"
+
 
 class ToolsHandler(BaseCallbackHandler):
     """Callback handler for tool usage."""
 
-    last_used_tool: Dict[str, Any] = {}
+    last_used_tool: ToolUse = ToolUse()
     cache: CacheHandler = None
 
     def __init__(self, cache: CacheHandler = None, **kwargs: Any):
-
         """
         Initialize the callback handler.
 
@@ -26,55 +91,70 @@ class ToolsHandler(BaseCallbackHandler):
 
         """
         self.cache = cache
+        # Tools running at the same time, by the run_id of their callbacks
+        self._running: Dict[UUID, ToolUse] = {}
         super().__init__(**kwargs)
 
     def on_tool_start(
         self, serialized: Dict[str, Any], input_str: str, **kwargs: Any
     ) -> Any:
-        
-        """        Run when tool starts running.
+        """Run when tool starts running.
 
-            Args:
-                serialized (Dict[str, Any]): Serialized data.
-                input_str (str): Input string.
-                **kwargs (Any): Additional keyword arguments.
+        Args:
+            serialized (Dict[str, Any]): Serialized data.
+            input_str (str): Input string.
+            **kwargs (Any): Additional keyword arguments.
 
-            Raises:
-                (Exception): If the 'name' is not in the list ["invalid_tool", "_Exception"].
+        Raises:
+            (Exception): If the 'name' is not in the list ["invalid_tool", "_Exception"].
 
-            Returns:
-                Any: The result of the function.
+        Returns:
+            Any: The result of the function.
         """
         name = serialized.get("name")
         if name not in ["invalid_tool", "_Exception"]:
-            tools_usage = {
-                "tool": name,
-                "input": input_str,
-            }
-            self.last_used_tool = tools_usage
+            tool_use = ToolUse(name, input_str)
+            self.last_used_tool = tool_use
+            run_id = kwargs.get("run_id")
+            if run_id is not None:
+                self._running[run_id] = tool_use
 
     def on_tool_end(self, output: str, **kwargs: Any) -> Any:
-        
-        """        Run when tool ends running.
+        """Run when tool ends running.
 
-            Args:
-                output (str): The output generated by the tool.
-                **kwargs (Any): Additional keyword arguments.
+        Args:
+            output (str): The output generated by the tool.
+            **kwargs (Any): Additional keyword arguments.
 
-            Raises:
-                (SomeException): This function may raise SomeException under certain conditions.
+        Raises:
+            (SomeException): This function may raise SomeException under certain conditions.
 
-            Returns:
-                Any: The return value of the function.
+        Returns:
+            Any: The return value of the function.
         """
+        # Tools of a step may overlap, each output is cached under its own call
+        tool_use = self._running.pop(kwargs.get("run_id"), self.last_used_tool)
         if (
             "is not a valid tool" not in output
             and "Invalid or incomplete response" not in output
             and "Invalid Format" not in output
         ):
-            if self.last_used_tool["tool"] != CacheTools().name:
+            if tool_use and tool_use.tool != _CACHE_TOOL_NAME:
                 self.cache.add(
-                    tool=self.last_used_tool["tool"],
-                    input=self.last_used_tool["input"],
+                    tool=tool_use.tool,
+                    input=tool_use.input,
                     output=output,
                 )
+
+    def on_tool_error(self, error: BaseException, **kwargs: Any) -> Any:
+        """
+        Run when tool errors, forgetting the failed call.
+
+        Args:
+            error (BaseException): The error raised by the tool.
+            **kwargs (Any): Additional keyword arguments.
+
+        Returns:
+            None
+        """
+        self._running.pop(kwargs.get("run_id"), None)
@@ -1,6 +1,6 @@
 import json
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import (
     UUID4,
@@ -44,6 +44,9 @@ class Crew(BaseModel):
     _cache_handler: Optional[InstanceOf[CacheHandler]] = PrivateAttr(
         default=CacheHandler()
     )
+    _agent_tools: Optional[Tuple[Tuple[Agent, ...], AgentTools]] = PrivateAttr(
+        default=None
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
     tasks: List[Task] = Field(default_factory=list)
     agents: List[Agent] = Field(default_factory=list)
@@ -55,6 +58,10 @@ class Crew(BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Cache shared by the agents without their own, a new one per crew when not set.",
+    )
     language: str = Field(
         default="en",
         description="Language used for the crew, defaults to English.",
@@ -110,7 +117,7 @@ class Crew(BaseModel):
         """
 
 
-        self._cache_handler = CacheHandler()
+        self._cache_handler = self.cache_handler or CacheHandler()
         self._logger = Logger(self.verbose)
         self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
         return self
@@ -139,7 +146,9 @@ class Crew(BaseModel):
 
         if self.agents:
             for agent in self.agents:
-                agent.set_cache_handler(self._cache_handler)
+                # Agents given their own cache handler keep it, normalizers included
+                if not agent._own_cache_handler:
+                    agent.set_cache_handler(self._cache_handler)
                 agent.set_rpm_controller(self._rpm_controller)
         return self
 
@@ -174,10 +183,10 @@ class Crew(BaseModel):
         - StopIteration: If no agent with the specified role is found in the list of agents.
         """
 
-        task_agent = next(
-            agt for agt in self.agents if agt.role == task_config["agent"]
-        )
-        del task_config["agent"]
+        # The config is left untouched, so a dict config can be reused for several crews
+        task_config = dict(task_config)
+        role = task_config.pop("agent")
+        task_agent = next(agt for agt in self.agents if agt.role == role)
         return Task(**task_config, agent=task_agent)
 
     def kickoff(self) -> str:
@@ -197,6 +206,26 @@ class Crew(BaseModel):
         if self.process == Process.sequential:
             return self._sequential_loop()
 
+    async def akickoff(self) -> str:
+        """
+        Starts the crew to work on its assigned tasks asynchronously.
+
+        Tasks still run one after the other, each one getting the previous output as
+        context, but several crews can be kicked off together in the same event loop.
+
+        Raises:
+            None
+
+        Returns:
+            str: If the process is sequential, returns the result of the _asequential_loop method.
+        """
+
+        for agent in self.agents:
+            agent.i18n = I18N(language=self.language)
+
+        if self.process == Process.sequential:
+            return await self._asequential_loop()
+
     def _sequential_loop(self) -> str:
         """
         Executes tasks sequentially and returns the final output.
@@ -220,6 +249,49 @@ class Crew(BaseModel):
             self._rpm_controller.stop_rpm_counter()
         return task_output
 
+    async def _asequential_loop(self) -> str:
+        """
+        Executes tasks sequentially and asynchronously and returns the final output.
+
+        Raises:
+            None
+
+        Returns:
+            str: The final output after executing all tasks sequentially.
+        """
+
+        task_output = None
+        for task in self.tasks:
+            self._prepare_and_execute_task(task)
+            task_output = await task.aexecute(task_output)
+            self._logger.log(
+                "debug", f"[{task.agent.role}] Task output: {task_output}\n\n"
+            )
+
+        if self.max_rpm:
+            self._rpm_controller.stop_rpm_counter()
+        return task_output
+
+    def _delegation_tools(self) -> List[Any]:
+        """
+        Return the tools to delegate to the crew's agents.
+
+        The same AgentTools is kept for all the tasks of the crew, so its tools are
+        only built once. It is invalidated when the crew's agents change.
+
+        Returns:
+            List[Any]: The delegation tools.
+        """
+        agents = tuple(self.agents)
+        if self._agent_tools is None:
+            self._agent_tools = (agents, AgentTools(agents=self.agents))
+        elif self._agent_tools[0] != agents:
+            agent_tools = self._agent_tools[1]
+            agent_tools.agents = list(agents)
+            agent_tools.invalidate()
+            self._agent_tools = (agents, agent_tools)
+        return self._agent_tools[1].tools()
+
     def _prepare_and_execute_task(self, task):
         """
         Prepares and logs information about the task being executed.
@@ -235,7 +307,7 @@ class Crew(BaseModel):
         """
         
         if task.agent.allow_delegation:
-            task.tools += AgentTools(agents=self.agents).tools()
+            task.tools += self._delegation_tools()
 
         self._logger.log("debug", f"Working Agent: {task.agent.role}")
         self._logger.log("info", f"Starting Task: {task.description}")
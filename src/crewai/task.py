@@ -1,7 +1,14 @@
 import uuid
-from typing import Any, List, Optional
-
-from pydantic import UUID4, BaseModel, Field, field_validator, model_validator
+from typing import Any, Dict, List, Optional
+
+from pydantic import (
+    UUID4,
+    BaseModel,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from pydantic_core import PydanticCustomError
 
 from crewai.agent import Agent
@@ -52,6 +59,22 @@ class Task(BaseModel):
                 "may_not_set_field", "This field is not to be set by the user.", {}
             )
 
+    @field_serializer("output")
+    def _serialize_output(
+        self, output: Optional[TaskOutput]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Serialize the output with its summary, which a dataclass dump would leave out.
+
+        Args:
+            output (Optional[TaskOutput]): The output of the task, if it ran.
+
+        Returns:
+            Optional[Dict[str, str]]: The dumped output, None if the task didn't run.
+        """
+
+        return output.model_dump() if output is not None else None
+
     @model_validator(mode="after")
     def check_tools(self):
         """
@@ -66,9 +89,11 @@ class Task(BaseModel):
             No specific exceptions are raised.
         """
 
-
-        if not self.tools and (self.agent and self.agent.tools):
-            self.tools.extend(self.agent.tools)
+        agent = self.agent
+        if not self.tools and agent is not None:
+            agent_tools = agent.tools
+            if agent_tools:
+                self.tools = list(agent_tools)
         return self
 
     def execute(self, context: str = None) -> str:
@@ -94,3 +119,28 @@ class Task(BaseModel):
 
         self.output = TaskOutput(description=self.description, result=result)
         return result
+
+    async def aexecute(self, context: str = None) -> str:
+        """
+        Execute the task asynchronously.
+
+        Args:
+            context (str, optional): The context in which the task should be executed. Defaults to None.
+
+        Returns:
+            str: Output of the task.
+
+        Raises:
+            Exception: If the task has no agent assigned, it cannot be executed directly and should be executed in a Crew using a specific process that supports that, either consensual or hierarchical.
+        """
+
+        if not self.agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, either consensual or hierarchical."
+            )
+        result = await self.agent.aexecute_task(
+            task=self.description, context=context, tools=self.tools
+        )
+
+        self.output = TaskOutput(description=self.description, result=result)
+        return result
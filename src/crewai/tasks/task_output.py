@@ -1,27 +1,52 @@
-from typing import Optional
+import json
+from dataclasses import dataclass
+from typing import Dict
 
-from pydantic import BaseModel, Field, model_validator
 
-
-class TaskOutput(BaseModel):
+@dataclass
+class TaskOutput:
     """Class that represents the result of a task."""
 
-    description: str = Field(description="Description of the task")
-    summary: Optional[str] = Field(description="Summary of the task", default=None)
-    result: str = Field(description="Result of the task")
+    __slots__ = ("description", "result")
+
+    description: str
+    result: str
 
-    @model_validator(mode="after")
-    def set_summary(self):
+    @property
+    def summary(self) -> str:
         """
-        Set the summary of the description by taking the first 10 words and appending '...' at the end.
+        Summary of the description, its first 10 words followed by '...'.
 
         Raises:
             None
 
         Returns:
-            self: The instance of the object with the summary set.
+            str: The summary of the task description.
+        """
+
+        excerpt = " ".join(self.description.split(" ", 10)[:10])
+        return f"{excerpt}..."
+
+    def model_dump(self) -> Dict[str, str]:
+        """
+        Return the output as a dict, with the same fields as the former pydantic model.
+
+        Returns:
+            Dict[str, str]: The description, summary and result of the task.
+        """
+
+        return {
+            "description": self.description,
+            "summary": self.summary,
+            "result": self.result,
+        }
+
+    def model_dump_json(self) -> str:
+        """
+        Return the output as a JSON string, with the same fields as `model_dump`.
+
+        Returns:
+            str: The description, summary and result of the task, as JSON.
         """
 
-        excerpt = " ".join(self.description.split(" ")[:10])
-        self.summary = f"{excerpt}..."
-        return self
+        return json.dumps(self.model_dump())
@@ -1,7 +1,9 @@
-from typing import List, Optional
+import difflib
+import sys
+from typing import Any, Dict, List, Optional
 
 from langchain.tools import Tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from crewai.agent import Agent
 from crewai.utilities import I18N
@@ -12,8 +14,43 @@ class AgentTools(BaseModel):
 
     agents: List[Agent] = Field(description="List of agents in this crew.")
     i18n: Optional[I18N] = Field(
-        default=I18N(), description="Internationalization settings."
+        default_factory=I18N, description="Internationalization settings."
     )
+    fuzzy: bool = Field(
+        default=False,
+        description="Route to the closest co-worker role when the given one doesn't match exactly.",
+    )
+    _agents_by_role: Dict[str, Agent] = PrivateAttr(default_factory=dict)
+    _agents_by_folded_role: Dict[str, Agent] = PrivateAttr(default_factory=dict)
+    _cached_tools: Optional[List[Any]] = PrivateAttr(default=None)
+    _coworkers_str: Optional[str] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def index_agents_by_role(self):
+        """
+        Index the agents by role so delegation doesn't scan the whole crew.
+
+        Returns:
+            self: The current instance with the role index set.
+        """
+        self.invalidate()
+        return self
+
+    def invalidate(self) -> None:
+        """
+        Rebuild the role index and drop the cached tools.
+
+        Must be called after mutating `agents`, otherwise delegation keeps using the previous co-workers.
+        """
+        # Reversed so the first agent holding a role wins when roles repeat.
+        self._agents_by_role = {
+            sys.intern(agent.role): agent for agent in reversed(self.agents)
+        }
+        self._agents_by_folded_role = {
+            agent.role.casefold(): agent for agent in reversed(self.agents)
+        }
+        self._cached_tools = None
+        self._coworkers_str = None
 
     def tools(self):
         """
@@ -30,23 +67,54 @@ class AgentTools(BaseModel):
             (if applicable)
         """
 
-
-        return [
-            Tool.from_function(
-                func=self.delegate_work,
-                name="Delegate work to co-worker",
-                description=self.i18n.tools("delegate_work").format(
-                    coworkers=", ".join([agent.role for agent in self.agents])
+        if self._cached_tools is None:
+            self._cached_tools = [
+                Tool.from_function(
+                    func=self.delegate_work,
+                    name="Delegate work to co-worker",
+                    description=self.i18n.tools("delegate_work").format(
+                        coworkers=self._coworkers()
+                    ),
                 ),
-            ),
-            Tool.from_function(
-                func=self.ask_question,
-                name="Ask question to co-worker",
-                description=self.i18n.tools("ask_question").format(
-                    coworkers=", ".join([agent.role for agent in self.agents])
+                Tool.from_function(
+                    func=self.ask_question,
+                    name="Ask question to co-worker",
+                    description=self.i18n.tools("ask_question").format(
+                        coworkers=self._coworkers()
+                    ),
                 ),
-            ),
-        ]
+            ]
+        return list(self._cached_tools)
+
+    def _coworkers(self) -> str:
+        """
+        Return the comma-separated roles of the co-workers, computed once.
+
+        Returns:
+            str: The roles of all agents, separated by commas.
+        """
+        if self._coworkers_str is None:
+            self._coworkers_str = ", ".join([agent.role for agent in self.agents])
+        return self._coworkers_str
+
+    def _find_agent(self, role: str) -> Optional[Agent]:
+        """
+        Return the co-worker holding a role, or the closest one when `fuzzy` is set.
+
+        Args:
+            role (str): The role mentioned on the action input.
+
+        Returns:
+            Optional[Agent]: The matching agent, if any.
+        """
+        agent = self._agents_by_role.get(sys.intern(role))
+        if agent is None and self.fuzzy:
+            matches = difflib.get_close_matches(
+                role.strip().casefold(), self._agents_by_folded_role, n=1
+            )
+            if matches:
+                agent = self._agents_by_folded_role[matches[0]]
+        return agent
 
     def delegate_work(self, command):
 
@@ -94,24 +162,17 @@ class AgentTools(BaseModel):
         Raises:
         - ValueError: If the command does not contain all three parts separated by '|'.
         """
-        try:
-            agent, task, context = command.split("|")
-        except ValueError:
-            return self.i18n.errors("agent_tool_missing_param")
+        agent, _, rest = command.partition("|")
+        task, _, context = rest.partition("|")
 
-        if not agent or not task or not context:
+        if not agent or not task or not context or "|" in context:
             return self.i18n.errors("agent_tool_missing_param")
 
-        agent = [
-            available_agent
-            for available_agent in self.agents
-            if available_agent.role == agent
-        ]
+        agent = self._find_agent(agent)
 
         if not agent:
             return self.i18n.errors("agent_tool_unexsiting_coworker").format(
-                coworkers=", ".join([agent.role for agent in self.agents])
+                coworkers=self._coworkers()
             )
 
-        agent = agent[0]
         return agent.execute_task(task, context)
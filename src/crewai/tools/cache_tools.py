@@ -1,3 +1,5 @@
+from typing import ClassVar, Tuple
+
 from langchain.tools import Tool
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -7,11 +9,14 @@ from crewai.agents.cache import CacheHandler
 class CacheTools(BaseModel):
     """Default tools to hit the cache."""
 
+    # Schema of the input `hit_cache` expects, built by the agent executor.
+    KEY_FORMAT: ClassVar[str] = "tool:{0}|input:{1}"
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
     name: str = "Hit Cache"
     cache_handler: CacheHandler = Field(
         description="Cache Handler for the crew",
-        default=CacheHandler(),
+        default_factory=CacheHandler,
     )
 
     def tool(self):
@@ -50,7 +55,19 @@ class CacheTools(BaseModel):
         """
 
         
-        split = key.split("tool:")
-        tool = split[1].split("|input:")[0].strip()
-        tool_input = split[1].split("|input:")[1].strip()
-        return self.cache_handler.read(tool, tool_input)
+        return self.cache_handler.read(*self.parse_key(key))
+
+    @staticmethod
+    def parse_key(key: str) -> Tuple[str, str]:
+        """
+        Split a key built with KEY_FORMAT back into the tool and its input.
+
+        Args:
+            key (str): The key, in the format "tool:<tool_name>|input:<input_data>".
+
+        Returns:
+            Tuple[str, str]: The name of the tool and its input.
+        """
+        _, _, rest = key.partition("tool:")
+        tool, _, tool_input = rest.partition("|input:")
+        return tool.strip(), tool_input.strip()
@@ -1,44 +1,88 @@
 import json
-import os
-from typing import Dict, Optional
+import sys
+from importlib.resources import files
+from typing import Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field, PrivateAttr, ValidationError, model_validator
+from pydantic import BaseModel, Field, model_validator
+from pydantic_core import PydanticCustomError
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+_TRANSLATIONS_DIR = files("crewai") / "translations"
+_TRANSLATIONS: Dict[str, Dict[Tuple[str, str], str]] = {}
+
+
+def _load_translation(language: str) -> Dict[Tuple[str, str], str]:
+    """
+    Load translations from a JSON file based on the specified language.
+
+    The parsed file is flattened into a (kind, key) map of interned strings and
+    kept per language, so all I18N instances share one copy.
+
+    :raises ValueError: If the translation file for the specified language is not found,
+        or if there is an error decoding JSON from it.
+
+    :return: The translations for the language, keyed by (kind, key).
+    """
+
+    try:
+        # Read through importlib.resources so zipped installs work too, as bytes
+        # since both orjson and json.loads decode them as UTF-8
+        raw = _loads((_TRANSLATIONS_DIR / f"{language}.json").read_bytes())
+    except FileNotFoundError:
+        raise ValueError(f"Translation file for language '{language}' not found.")
+    except json.JSONDecodeError:
+        raise ValueError("Error decoding JSON from the prompts file.")
+    # Interned so keys shared by every language, and repeated values, are stored once
+    translations = {
+        (sys.intern(kind), sys.intern(key)): sys.intern(value)
+        for kind, entries in raw.items()
+        for key, value in entries.items()
+    }
+    _TRANSLATIONS[language] = translations
+    return translations
 
 
 class I18N(BaseModel):
-    _translations: Optional[Dict[str, str]] = PrivateAttr()
     language: Optional[str] = Field(
         default="en",
         description="Language used to load translations",
     )
 
     @model_validator(mode="after")
-    def load_translation(self) -> "I18N":
+    def check_language(self):
         """
-        Load translations from a JSON file based on the specified language.
+        Validate that there is a translation file for the language, without parsing it.
 
-        :raises FileNotFoundError: If the translation file for the specified language is not found.
-        :raises ValidationError: If there is an error decoding JSON from the prompts file.
+        Raises:
+            PydanticCustomError: If the translation file for the language is not found.
 
-        :return: Instance of the 'I18N' class.
+        Returns:
+            self: The current instance of the class after validation.
         """
 
-        try:
-            dir_path = os.path.dirname(os.path.realpath(__file__))
-            prompts_path = os.path.join(
-                dir_path, f"../translations/{self.language}.json"
+        if (
+            self.language not in _TRANSLATIONS
+            and not (_TRANSLATIONS_DIR / f"{self.language}.json").is_file()
+        ):
+            raise PydanticCustomError(
+                "missing_translation",
+                "Translation file for language '{language}' not found.",
+                {"language": self.language},
             )
-
-            with open(prompts_path, "r") as f:
-                self._translations = json.load(f)
-        except FileNotFoundError:
-            raise ValidationError(
-                f"Trasnlation file for language '{self.language}' not found."
-            )
-        except json.JSONDecodeError:
-            raise ValidationError(f"Error decoding JSON from the prompts file.")
         return self
 
+    @property
+    def _translations(self) -> Dict[Tuple[str, str], str]:
+        """Translations for the language, read from disk the first time they are needed."""
+        translations = _TRANSLATIONS.get(self.language)
+        if translations is None:
+            translations = _load_translation(self.language)
+        return translations
+
     def slice(self, slice: str) -> str:
         """
         Retrieve the specified slice from the 'slices' collection.
@@ -102,11 +146,10 @@ class I18N(BaseModel):
         str: The translation for the given kind and key.
 
         Raises:
-        ValidationError: If the translation for the specified kind and key is not found.
+        KeyError: If the translation for the specified kind and key is not found.
         """
 
-        
-        try:
-            return self._translations[kind].get(key)
-        except:
-            raise ValidationError(f"Translation for '{kind}':'{key}'  not found.")
+        value = self._translations.get((kind, key))
+        if value is None:
+            raise KeyError(f"Translation for '{kind}':'{key}' not found.")
+        return value
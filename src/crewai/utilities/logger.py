@@ -1,4 +1,12 @@
+import sys
+
+
 class Logger:
+    __slots__ = ("verbose_level",)
+
+    _LEVELS = {"debug": 1, "info": 2}
+    _LABELS = {"debug": "DEBUG", "info": "INFO"}
+
     def __init__(self, verbose_level=0):
         """
         Initialize the class with a specified verbose level.
@@ -14,9 +22,10 @@ class Logger:
         """
 
         
-        verbose_level = (
-            2 if isinstance(verbose_level, bool) and verbose_level else verbose_level
-        )
+        if verbose_level is True:
+            verbose_level = 2
+        elif verbose_level is False:
+            verbose_level = 0
         self.verbose_level = verbose_level
 
     def log(self, level, message):
@@ -35,6 +44,9 @@ class Logger:
         """
 
 
-        level_map = {"debug": 1, "info": 2}
-        if self.verbose_level and level_map.get(level, 0) <= self.verbose_level:
-            print(f"\n[{level.upper()}]: {message}")
+        verbose_level = self.verbose_level
+        if not verbose_level or self._LEVELS.get(level, 0) > verbose_level:
+            return
+        label = self._LABELS.get(level) or level.upper()
+        # sys.stdout is looked up per call so redirected streams are honoured
+        sys.stdout.write(f"\n[{label}]: {message}\n")
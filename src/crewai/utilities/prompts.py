@@ -1,4 +1,5 @@
-from typing import ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar, Tuple
 
 from langchain.prompts import PromptTemplate
 from pydantic import BaseModel, Field
@@ -6,10 +7,37 @@ from pydantic import BaseModel, Field
 from crewai.utilities import I18N
 
 
+class _FormatMapPromptTemplate(PromptTemplate):
+    """PromptTemplate rendered with str.format_map rather than langchain's pure Python formatter."""
+
+    def format(self, **kwargs: Any) -> str:
+        """
+        Format the prompt with the inputs.
+
+        Args:
+            kwargs: The values for the template's input variables.
+
+        Returns:
+            str: The formatted prompt.
+        """
+        return self.template.format_map(
+            self._merge_partial_and_user_variables(**kwargs)
+        )
+
+
+@lru_cache(maxsize=64)
+def _cached_build(language: str, components: Tuple[str, ...]) -> PromptTemplate:
+    """Build the prompt template for a language and its components, once per pair."""
+    i18n = I18N(language=language)
+    prompt_parts = [i18n.slice(component) for component in components]
+    prompt_parts.append(Prompts.SCRATCHPAD_SLICE)
+    return _FormatMapPromptTemplate.from_template("".join(prompt_parts))
+
+
 class Prompts(BaseModel):
     """Manages and generates prompts for a generic agent with support for different languages."""
 
-    i18n: I18N = Field(default=I18N())
+    i18n: I18N = Field(default_factory=I18N)
 
     SCRATCHPAD_SLICE: ClassVar[str] = "\n{agent_scratchpad}"
 
@@ -24,7 +52,7 @@ class Prompts(BaseModel):
         Raises:
             None
         """
-        return self._build_prompt(["role_playing", "tools", "memory", "task"])
+        return self._build_prompt(("role_playing", "tools", "memory", "task"))
 
     def task_execution_without_tools(self) -> str:
 
@@ -38,7 +66,7 @@ class Prompts(BaseModel):
             None
 
         """
-        return self._build_prompt(["role_playing", "task"])
+        return self._build_prompt(("role_playing", "task"))
 
     def task_execution(self) -> str:
 
@@ -51,7 +79,7 @@ class Prompts(BaseModel):
         Raises:
             None
         """
-        return self._build_prompt(["role_playing", "tools", "task"])
+        return self._build_prompt(("role_playing", "tools", "task"))
 
     def _build_prompt(self, components: [str]) -> str:
         
@@ -67,6 +95,4 @@ class Prompts(BaseModel):
         Raises:
         This method does not raise any exceptions.
         """
-        prompt_parts = [self.i18n.slice(component) for component in components]
-        prompt_parts.append(self.SCRATCHPAD_SLICE)
-        return PromptTemplate.from_template("".join(prompt_parts))
+        return _cached_build(self.i18n.language, tuple(components))
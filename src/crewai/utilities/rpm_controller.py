@@ -1,43 +1,81 @@
 import threading
 import time
-from typing import Union
-
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+import weakref
+from typing import ClassVar, Union
 
 from crewai.utilities.logger import Logger
 
 
-class RPMController(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    max_rpm: Union[int, None] = Field(default=None)
-    logger: Logger = Field(default=None)
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: threading.Timer = PrivateAttr(default=None)
-    _lock: threading.Lock = PrivateAttr(default=None)
+class RPMController:
+    __slots__ = ("max_rpm", "logger", "_tokens", "_last_refill", "_lock", "__weakref__")
 
-    @model_validator(mode="after")
-    def reset_counter(self):
-        """
-        Reset the counter and acquire a lock if max_rpm is set.
+    _shared: ClassVar[
+        "weakref.WeakValueDictionary[int, RPMController]"
+    ] = weakref.WeakValueDictionary()
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
 
-        :return: self
-        :raises: Any exceptions that may occur during the reset process.
+    def __init__(self, max_rpm: Union[int, None] = None, logger: Logger = None):
         """
+        Initialize the controller, filling the bucket and creating a lock if max_rpm is set.
+
+        Args:
+            max_rpm (Union[int, None]): The maximum number of requests per minute, no limit when None.
+            logger (Logger): The logger used to report when the limit is reached.
 
+        Raises:
+            None
+
+        Returns:
+            None
+        """
 
+        self.max_rpm = max_rpm
+        self.logger = logger
+        self._tokens = 0.0
+        self._last_refill = 0.0
+        self._lock = None
         if self.max_rpm:
             self._lock = threading.Lock()
-            self._reset_request_count()
-        return self
+            self._tokens = float(self.max_rpm)
+            self._last_refill = time.monotonic()
 
-    def check_or_wait(self):
+    @classmethod
+    def shared(cls, max_rpm: int, logger: Logger) -> "RPMController":
         """
-        Check if the current RPM is less than the maximum RPM. If so, increment the current RPM and return True.
-        If the current RPM is equal to the maximum RPM, log a message, wait for the next minute, reset the current RPM to 1, and return True.
+        Return the controller shared by everyone limited to max_rpm, creating it if needed.
+
+        Useful when several crews use the same API key, so their requests count
+        against one limit. The controller lives as long as someone holds it, and
+        keeps the logger it was first created with.
+
+        Args:
+            max_rpm (int): The maximum number of requests per minute.
+            logger (Logger): The logger used if a new controller is created.
 
         Raises:
-            <Exception Type>: <Description of when this exception might be raised>
+            None
+
+        Returns:
+            RPMController: The shared controller.
+        """
+
+        with cls._shared_lock:
+            controller = cls._shared.get(max_rpm)
+            if controller is None:
+                controller = cls(max_rpm=max_rpm, logger=logger)
+                cls._shared[max_rpm] = controller
+            return controller
 
+    def check_or_wait(self):
+        """
+        Check if a request can be made within the maximum RPM and take a token for it.
+
+        The bucket holds up to max_rpm tokens and refills continuously at max_rpm
+        tokens per minute, so requests are spread out instead of bursting at every
+        minute boundary. When no token is left, log a message, wait for one and return True.
+
+        Raises:
+            None
         """
 
 
@@ -45,22 +83,26 @@ class RPMController(BaseModel):
             return True
 
         with self._lock:
-            if self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
                 return True
             else:
                 self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
+                    "info", "Max RPM reached, waiting for the rate limit to refill."
                 )
                 self._wait_for_next_minute()
-                self._current_rpm = 1
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
                 return True
 
     def stop_rpm_counter(self):
         """
         Stop the RPM counter.
 
-        This method cancels the timer used for counting RPM if it is running.
+        The bucket is refilled on every request instead of being reset by a timer,
+        so there is nothing left running to stop. Kept for the agents and crews
+        that call it once they are done.
 
         Raises:
             None
@@ -69,40 +111,27 @@ class RPMController(BaseModel):
             None
         """
 
-
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
-
-    def _wait_for_next_minute(self):
+    def _refill(self):
         """
-        Wait for the next minute and reset the current RPM to 0.
-
-        This method sleeps for 60 seconds and then resets the current RPM to 0
-        after acquiring the lock.
+        Add the tokens earned since the last refill, up to max_rpm.
 
         Raises:
-            (Exception): Any exception that occurs during the sleep or lock acquisition.
+            None
         """
 
+        now = time.monotonic()
+        rate = self.max_rpm / 60.0
+        self._tokens = min(
+            float(self.max_rpm), self._tokens + (now - self._last_refill) * rate
+        )
+        self._last_refill = now
 
-        time.sleep(60)
-        with self._lock:
-            self._current_rpm = 0
-
-    def _reset_request_count(self):
+    def _wait_for_next_minute(self):
         """
-        Reset the request count and start a new timer for resetting the count after 60 seconds.
+        Wait until the bucket has earned the next token.
 
         Raises:
-            <ExceptionType>: <Description of the exception raised>
-
+            None
         """
 
-        
-        with self._lock:
-            self._current_rpm = 0
-        if self._timer:
-            self._timer.cancel()
-        self._timer = threading.Timer(60.0, self._reset_request_count)
-        self._timer.start()
+        time.sleep((1 - self._tokens) * 60.0 / self.max_rpm)
@@ -3,16 +3,14 @@
 from unittest.mock import patch
 
 import pytest
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI as OpenAI
 
 from crewai import Agent, Crew, Task
-from crewai.agents.cache import CacheHandler
+from crewai.agents.cache import CacheHandler, PlanCache
 from crewai.agents.executor import CrewAgentExecutor
-from crewai.utilities import RPMController
+from crewai.utilities import Logger, RPMController
 
 
-def test_agent_creation():
+def test_agent_creation(agent):
     """
     Test the creation of an Agent instance.
 
@@ -21,15 +19,13 @@ def test_agent_creation():
 
     """
 
-    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
-
     assert agent.role == "test role"
     assert agent.goal == "test goal"
     assert agent.backstory == "test backstory"
     assert agent.tools == []
 
 
-def test_agent_default_values():
+def test_agent_default_values(agent):
     """
     Test the default values of the Agent class.
 
@@ -38,7 +34,7 @@ def test_agent_default_values():
 
     """
 
-    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    from langchain_openai import ChatOpenAI as OpenAI
 
     assert isinstance(agent.llm, OpenAI)
     assert agent.llm.model_name == "gpt-4"
@@ -47,6 +43,42 @@ def test_agent_default_values():
     assert agent.allow_delegation == True
 
 
+def test_default_llm_is_not_shared_between_agents():
+    """
+    Test that agents get their own default llm, still sharing one OpenAI client.
+
+    Raises:
+        AssertionError: If changing the llm of one agent affects the other, or the client isn't shared.
+    """
+
+    first = Agent(role="first", goal="test goal", backstory="test backstory")
+    second = Agent(role="second", goal="test goal", backstory="test backstory")
+
+    assert first.llm is not second.llm
+    assert first.llm.client is second.llm.client
+    assert first.llm.async_client is second.llm.async_client
+
+    first.llm.temperature = 0.0
+    assert second.llm.temperature == 0.7
+
+
+def test_agents_have_their_own_cache_handler():
+    """
+    Test that agents outside of a crew don't share tool results.
+
+    Raises:
+        AssertionError: If two agents share a cache handler by default.
+    """
+
+    first = Agent(role="first", goal="test goal", backstory="test backstory")
+    second = Agent(role="second", goal="test goal", backstory="test backstory")
+
+    first.cache_handler.add("multiplier", "3,4", "12")
+
+    assert first.cache_handler is not second.cache_handler
+    assert second.cache_handler.read("multiplier", "3,4") is None
+
+
 def test_custom_llm():
     """
     Test the custom LLM (Language Model) configuration for the Agent class.
@@ -58,6 +90,8 @@ def test_custom_llm():
 
     """
 
+    from langchain_openai import ChatOpenAI as OpenAI
+
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -82,6 +116,8 @@ def test_agent_without_memory():
         AssertionError: If the test results or memory state assertions fail.
     """
 
+    from langchain_openai import ChatOpenAI as OpenAI
+
     no_memory_agent = Agent(
         role="test role",
         goal="test goal",
@@ -130,7 +166,7 @@ def test_agent_execution():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_execution_with_tools():
+def test_agent_execution_with_tools(multiplier):
     """
     Test the execution of an agent with tools.
 
@@ -144,27 +180,6 @@ def test_agent_execution_with_tools():
 
     """
 
-    @tool
-    def multiplier(numbers) -> float:
-        """
-        Useful for when you need to multiply two numbers together.
-
-        Args:
-        numbers (str): A comma separated list of numbers of length two, representing the two numbers you want to multiply together.
-
-        Returns:
-        float: The result of multiplying the two input numbers together.
-
-        Raises:
-        ValueError: If the input format is incorrect or if the input numbers are not valid.
-
-        Example:
-        >>> multiplier("2,3")
-        6
-        """
-        a, b = numbers.split(",")
-        return int(a) * int(b)
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -178,7 +193,7 @@ def test_agent_execution_with_tools():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_logging_tool_usage():
+def test_logging_tool_usage(multiplier):
     """    Test the usage of logging tools.
 
         This function tests the usage of logging tools by creating a multiplier tool and an agent, and then executing a task to check the output and tool usage.
@@ -188,23 +203,6 @@ def test_logging_tool_usage():
 
     """
 
-    @tool
-    def multiplier(numbers) -> float:
-        """
-        Useful for when you need to multiply two numbers together.
-
-        Args:
-        numbers (str): A comma separated list of numbers of length two, representing the two numbers you want to multiply together.
-
-        Returns:
-        float: The result of multiplying the two input numbers together.
-
-        Raises:
-        ValueError: If the input is not in the correct format (e.g., not a comma separated list of two numbers).
-        """
-        a, b = numbers.split(",")
-        return int(a) * int(b)
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -226,7 +224,7 @@ def test_logging_tool_usage():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_cache_hitting():
+def test_cache_hitting(multiplier):
     """
     Test the cache handling functionality of the Agent class.
 
@@ -236,26 +234,6 @@ def test_cache_hitting():
         AssertionError: If the cache handling functionality does not work as expected.
     """
 
-    @tool
-    def multiplier(numbers) -> float:
-        """        Multiply two numbers together.
-
-            Args:
-                numbers (str): A comma separated list of two numbers to be multiplied.
-
-            Returns:
-                float: The result of multiplying the two input numbers together.
-
-            Raises:
-                ValueError: If the input does not contain exactly two numbers separated by a comma.
-
-            Example:
-                >>> multiplier('2,3')
-                6
-        """
-        a, b = numbers.split(",")
-        return int(a) * int(b)
-
     cache_handler = CacheHandler()
 
     agent = Agent(
@@ -271,9 +249,9 @@ def test_cache_hitting():
     output = agent.execute_task("What is 2 times 6 times 3?")
     output = agent.execute_task("What is 3 times 3?")
     assert cache_handler._cache == {
-        "multiplier-12,3": "36",
-        "multiplier-2,6": "12",
-        "multiplier-3,3": "9",
+        ("multiplier", "12,3"): "36",
+        ("multiplier", "2,6"): "12",
+        ("multiplier", "3,3"): "9",
     }
 
     output = agent.execute_task("What is 2 times 6 times 3? Return only the number")
@@ -287,7 +265,7 @@ def test_cache_hitting():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_execution_with_specific_tools():
+def test_agent_execution_with_specific_tools(multiplier):
     """
     Test the execution of an agent with specific tools.
 
@@ -300,27 +278,6 @@ def test_agent_execution_with_specific_tools():
 
     """
 
-    @tool
-    def multiplier(numbers) -> float:
-        """
-        Useful for when you need to multiply two numbers together.
-
-        Args:
-        numbers (str): A comma separated list of numbers of length two, representing the two numbers you want to multiply together.
-
-        Returns:
-        float: The result of multiplying the two input numbers together.
-
-        Raises:
-        ValueError: If the input format is incorrect or if the input numbers are not valid.
-
-        Example:
-        >>> multiplier("2,3")
-        6
-        """
-        a, b = numbers.split(",")
-        return int(a) * int(b)
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -333,7 +290,7 @@ def test_agent_execution_with_specific_tools():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_custom_max_iterations():
+def test_agent_custom_max_iterations(get_final_answer):
     """
     Test the custom max iterations for the agent.
 
@@ -344,19 +301,6 @@ def test_agent_custom_max_iterations():
 
     """
 
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this
-        tool non-stop.
-
-        :param numbers: Input numbers
-        :type numbers: Any
-        :return: The final answer
-        :rtype: float
-        """
-        return 42
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -376,7 +320,7 @@ def test_agent_custom_max_iterations():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_moved_on_after_max_iterations():
+def test_agent_moved_on_after_max_iterations(get_final_answer):
     """
     Test that the agent moves on after reaching the maximum iterations.
 
@@ -386,23 +330,6 @@ def test_agent_moved_on_after_max_iterations():
         AssertionError: If the agent does not move on after reaching the maximum iterations.
     """
 
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this
-        tool non-stop.
-
-        Args:
-        - numbers: A list of numbers.
-
-        Returns:
-        - float: The final answer.
-
-        Raises:
-        - This function does not raise any exceptions.
-        """
-        return 42
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -426,7 +353,7 @@ def test_agent_moved_on_after_max_iterations():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_respect_the_max_rpm_set(capsys):
+def test_agent_respect_the_max_rpm_set(capsys, get_final_answer):
     """
     Test if the agent respects the maximum RPM set.
 
@@ -440,22 +367,6 @@ def test_agent_respect_the_max_rpm_set(capsys):
     No return value.
     """
 
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this tool non-stop.
-
-        Args:
-        - numbers: A list of numbers for calculation
-
-        Returns:
-        - float: The final answer calculated from the input numbers
-
-        Raises:
-        - This function does not raise any specific exceptions.
-        """
-        return 42
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -477,12 +388,12 @@ def test_agent_respect_the_max_rpm_set(capsys):
             == "I've used the `get_final_answer` tool multiple times and it consistently returns the number 42."
         )
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the rate limit to refill." in captured.out
         moveon.assert_called()
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
+def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys, get_final_answer):
     """    Test if the agent respects the maximum RPM set over the crew RPM.
 
         Args:
@@ -495,25 +406,6 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     from unittest.mock import patch
 
-    from langchain.tools import tool
-
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this
-        tool non-stop.
-
-        Args:
-        - numbers: A list of numbers.
-
-        Returns:
-        - float: The final answer.
-
-        Raises:
-        - This function does not raise any exceptions.
-        """
-        return 42
-
     agent = Agent(
         role="test role",
         goal="test goal",
@@ -535,12 +427,12 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached, waiting for the rate limit to refill." not in captured.out
         moveon.assert_not_called()
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_agent_without_max_rpm_respet_crew_rpm(capsys):
+def test_agent_without_max_rpm_respet_crew_rpm(capsys, get_final_answer):
     """    Test the behavior of an agent when the maximum RPM is not respected by the crew RPM.
 
         Args:
@@ -553,25 +445,6 @@ def test_agent_without_max_rpm_respet_crew_rpm(capsys):
 
     from unittest.mock import patch
 
-    from langchain.tools import tool
-
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this
-        tool non-stop.
-
-        Args:
-        - numbers: A list of numbers.
-
-        Returns:
-        - float: The final answer.
-
-        Raises:
-        - This function does not raise any exceptions.
-        """
-        return 42
-
     agent1 = Agent(
         role="test role",
         goal="test goal",
@@ -607,5 +480,619 @@ def test_agent_without_max_rpm_respet_crew_rpm(capsys):
         crew.kickoff()
         captured = capsys.readouterr()
         assert "Action: get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the rate limit to refill." in captured.out
+        moveon.assert_called_once()
+
+
+def test_agent_executor_runs_multiple_actions_concurrently(multiplier):
+    """
+    Test that multiple actions planned in one step are dispatched to the tool pool.
+
+    Raises:
+        AssertionError: If the steps are not returned in the planned order or a failing tool is not isolated.
+    """
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentStep
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        allow_delegation=False,
+    )
+    executor = agent.agent_executor
+    executor.tool_concurrency = 2
+
+    actions = [
+        AgentAction("multiplier", "2,3", ""),
+        AgentAction("multiplier", "not numbers", ""),
+        AgentAction("multiplier", "3,4", ""),
+    ]
+    with patch.object(RunnableAgent, "plan", return_value=actions):
+        steps = [
+            step
+            for step in executor._iter_next_step(
+                {"multiplier": multiplier}, {"multiplier": "blue"}, {}, []
+            )
+            if isinstance(step, AgentStep)
+        ]
+
+    assert [step.action for step in steps] == actions
+    assert steps[0].observation == 6
+    assert steps[1].observation.startswith("\nError executing tool.")
+    assert steps[2].observation == 12
+
+
+def test_agent_executor_async_invoke(multiplier):
+    """
+    Test that the async execution path goes through the crewAI executor loop.
+
+    Raises:
+        AssertionError: If the tool is not used or the final answer is not returned.
+    """
+
+    import asyncio
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+    )
+
+    plan = [
+        AgentAction("multiplier", "3,4", ""),
+        AgentFinish({"output": "12"}, ""),
+    ]
+    with patch.object(RunnableAgent, "aplan", side_effect=plan) as aplan:
+        result = asyncio.run(
+            agent.agent_executor.ainvoke(
+                {"input": "What is 3 times 4", "tool_names": "", "tools": ""}
+            )
+        )
+
+    assert result["output"] == "12"
+    assert aplan.call_count == 2
+    assert aplan.call_args.args[0][0][1] == 12
+
+
+def test_agent_replays_plan_of_repeated_task(multiplier):
+    """
+    Test that a repeated task replays the tool actions of its previous run instead of planning them again.
+
+    Raises:
+        AssertionError: If the planner is called for the replayed actions or they aren't read from the cache.
+    """
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=CacheHandler(),
+        plan_cache=PlanCache(),
+    )
+
+    first_run = [
+        AgentAction("multiplier", "2,6", "Action: multiplier\nAction Input: 2,6"),
+        AgentAction("multiplier", "12,3", "Action: multiplier\nAction Input: 12,3"),
+        AgentFinish({"output": "36"}, "Final Answer: 36"),
+    ]
+    with patch.object(RunnableAgent, "plan", side_effect=first_run) as plan:
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+    assert plan.call_count == 3
+
+    with patch.object(
+        RunnableAgent, "plan", return_value=AgentFinish({"output": "36"}, "")
+    ) as plan:
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+
+    plan.assert_called_once()
+    replayed = plan.call_args.args[0]
+    assert [action.tool for action, _ in replayed] == ["Hit Cache", "Hit Cache"]
+    assert [observation for _, observation in replayed] == ["12", "36"]
+
+
+def test_agent_replays_plan_only_from_the_cache(multiplier):
+    """
+    Test that a replayed plan stops at its first action whose result isn't cached anymore.
+
+    Raises:
+        AssertionError: If an action is replayed without its result in the cache.
+    """
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+        plan_cache=PlanCache(),
+    )
+
+    first_run = [
+        AgentAction("multiplier", "2,6", "Action: multiplier\nAction Input: 2,6"),
+        AgentAction("multiplier", "12,3", "Action: multiplier\nAction Input: 12,3"),
+        AgentFinish({"output": "36"}, "Final Answer: 36"),
+    ]
+    with patch.object(RunnableAgent, "plan", side_effect=first_run):
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+    del cache_handler._cache[("multiplier", "12,3")]
+
+    with patch.object(
+        RunnableAgent, "plan", return_value=AgentFinish({"output": "36"}, "")
+    ) as plan:
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+
+    replayed = plan.call_args.args[0]
+    assert [(action.tool, observation) for action, observation in replayed] == [
+        ("Hit Cache", "12")
+    ]
+    assert cache_handler.read("multiplier", "12,3") is None
+
+
+def test_agent_plan_keeps_a_tool_answering_like_a_refusal():
+    """
+    Test that a tool whose output reads like the forced answer error is still remembered.
+
+    Raises:
+        AssertionError: If the action is left out of the replayed plan.
+    """
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+    from langchain_core.tools import tool
+
+    from crewai.utilities import I18N
+
+    refusal = I18N().errors("used_too_many_tools")
+
+    @tool
+    def echo(text: str) -> str:
+        """Useful for when you need to repeat a text."""
+        return text
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[echo],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=CacheHandler(),
+        plan_cache=PlanCache(),
+    )
+
+    first_run = [
+        AgentAction("echo", refusal, f"Action: echo\nAction Input: {refusal}"),
+        AgentFinish({"output": "done"}, "Final Answer: done"),
+    ]
+    with patch.object(RunnableAgent, "plan", side_effect=first_run):
+        assert agent.execute_task("Repeat the refusal") == "done"
+
+    with patch.object(
+        RunnableAgent, "plan", return_value=AgentFinish({"output": "done"}, "")
+    ) as plan:
+        assert agent.execute_task("Repeat the refusal") == "done"
+
+    replayed = plan.call_args.args[0]
+    assert [observation for _, observation in replayed] == [refusal]
+
+
+def test_agent_plan_leaves_out_actions_refused_to_force_the_answer(multiplier):
+    """
+    Test that an action refused to force the answer isn't replayed, since its tool never ran.
+
+    Raises:
+        AssertionError: If the refused action is part of the replayed plan.
+    """
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        max_iter=4,
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+        plan_cache=PlanCache(),
+    )
+
+    first_run = [
+        AgentAction("multiplier", "2,6", "Action: multiplier\nAction Input: 2,6"),
+        AgentAction("multiplier", "12,3", "Action: multiplier\nAction Input: 12,3"),
+        AgentAction("multiplier", "36,2", "Action: multiplier\nAction Input: 36,2"),
+        AgentFinish({"output": "36"}, "Final Answer: 36"),
+    ]
+    with patch.object(RunnableAgent, "plan", side_effect=first_run):
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+    assert cache_handler.read("multiplier", "36,2") is None
+
+    with patch.object(
+        RunnableAgent, "plan", return_value=AgentFinish({"output": "36"}, "")
+    ) as plan:
+        assert agent.execute_task("What is 2 times 6 times 3?") == "36"
+
+    replayed = plan.call_args.args[0]
+    assert [observation for _, observation in replayed] == ["12", "36"]
+
+
+def test_agent_picks_tools_with_tool_llm(multiplier):
+    """
+    Test that the tools are picked by `tool_llm` while the final answer is still written by `llm`.
+
+    Raises:
+        AssertionError: If the tool isn't used or the final answer doesn't come from `llm`.
+    """
+
+    from langchain_community.chat_models.fake import FakeListChatModel
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+        llm=FakeListChatModel(responses=["Thought: done\nFinal Answer: 12"]),
+        tool_llm=FakeListChatModel(
+            responses=[
+                "Thought: I need to multiply\nAction: multiplier\nAction Input: 3,4",
+                "Thought: done\nFinal Answer: twelve",
+            ]
+        ),
+    )
+
+    assert agent.execute_task("What is 3 times 4?") == "12"
+    assert cache_handler.read("multiplier", "3,4") == "12"
+
+
+def test_agent_ignores_tools_picked_by_llm_for_the_final_answer(multiplier):
+    """
+    Test that a tool picked by `llm` when asked for the final answer isn't run.
+
+    Raises:
+        AssertionError: If the tool runs or the final answer of `tool_llm` isn't kept.
+    """
+
+    from langchain_community.chat_models.fake import FakeListChatModel
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+        llm=FakeListChatModel(
+            responses=[
+                "Thought: I need to multiply\nAction: multiplier\nAction Input: 3,4"
+            ]
+        ),
+        tool_llm=FakeListChatModel(responses=["Thought: done\nFinal Answer: twelve"]),
+    )
+
+    assert agent.execute_task("What is 3 times 4?") == "twelve"
+    assert cache_handler.read("multiplier", "3,4") is None
+
+
+@pytest.mark.parametrize("tool_concurrency", [1, 2])
+def test_agent_executor_async_caches_each_tool_under_its_own_input(
+    multiplier, tool_concurrency
+):
+    """
+    Test that the tools of an async step are cached under their own input, even when overlapping.
+
+    Raises:
+        AssertionError: If an output is cached under the input of another tool call.
+    """
+
+    import asyncio
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+    )
+    agent.agent_executor.tool_concurrency = tool_concurrency
+
+    plan = [
+        [
+            AgentAction("multiplier", "2,3", ""),
+            AgentAction("multiplier", "3,4", ""),
+            AgentAction("multiplier", "4,5", ""),
+        ],
+        AgentFinish({"output": "done"}, ""),
+    ]
+    with patch.object(RunnableAgent, "aplan", side_effect=plan):
+        asyncio.run(agent.aexecute_task("Multiply them all"))
+
+    assert cache_handler._cache == {
+        ("multiplier", "2,3"): "6",
+        ("multiplier", "3,4"): "12",
+        ("multiplier", "4,5"): "20",
+    }
+
+
+def test_agent_executor_thread_pool_caches_each_tool_under_its_own_input(multiplier):
+    """
+    Test that concurrent tools are cached under their own input, and leave no worker threads behind.
+
+    Raises:
+        AssertionError: If an output is cached under another input or the pool outlives the step.
+    """
+
+    import threading
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    cache_handler = CacheHandler()
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+    )
+    agent.agent_executor.tool_concurrency = 3
+
+    plan = [
+        [
+            AgentAction("multiplier", "2,3", ""),
+            AgentAction("multiplier", "3,4", ""),
+            AgentAction("multiplier", "4,5", ""),
+        ],
+        AgentFinish({"output": "done"}, ""),
+    ]
+    threads = threading.active_count()
+    with patch.object(RunnableAgent, "plan", side_effect=plan):
+        agent.execute_task("Multiply them all")
+
+    assert threading.active_count() == threads
+    assert cache_handler._cache == {
+        ("multiplier", "2,3"): "6",
+        ("multiplier", "3,4"): "12",
+        ("multiplier", "4,5"): "20",
+    }
+
+
+def test_cache_handler_evicts_least_recently_used():
+    """
+    Test that the cache handler keeps at most `max_size` entries, evicting the least recently used.
+
+    Raises:
+        AssertionError: If the wrong entry is evicted.
+    """
+
+    cache_handler = CacheHandler(max_size=2)
+    cache_handler.add("multiplier", "2,6", "12")
+    cache_handler.add("multiplier", "3,3", "9")
+    assert cache_handler.read("multiplier", "2,6") == "12"
+
+    cache_handler.add("multiplier", "12,3", "36")
+
+    assert cache_handler.read("multiplier", "3,3") is None
+    assert cache_handler.read("multiplier", "2,6") == "12"
+    assert cache_handler.read("multiplier", "12,3") == "36"
+
+
+def test_rpm_controller_refills_tokens_over_time():
+    """
+    Test that the RPM controller earns a token back once enough time has passed, without waiting.
+
+    Raises:
+        AssertionError: If the controller waits instead of using the refilled token.
+    """
+
+    rpm_controller = RPMController(max_rpm=1, logger=Logger(verbose_level=2))
+    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+        assert rpm_controller.check_or_wait()
+        with patch(
+            "crewai.utilities.rpm_controller.time.monotonic",
+            return_value=rpm_controller._last_refill + 61,
+        ):
+            assert rpm_controller.check_or_wait()
+        moveon.assert_not_called()
+
+        assert rpm_controller.check_or_wait()
         moveon.assert_called_once()
+
+
+def test_rpm_controller_shared_per_max_rpm():
+    """
+    Test that shared RPM controllers are reused for the same max_rpm only.
+
+    Raises:
+        AssertionError: If a controller isn't shared or is shared across limits.
+    """
+
+    logger = Logger(verbose_level=2)
+    rpm_controller = RPMController.shared(max_rpm=5, logger=logger)
+
+    assert RPMController.shared(max_rpm=5, logger=logger) is rpm_controller
+    assert RPMController.shared(max_rpm=6, logger=logger) is not rpm_controller
+
+
+def test_cache_handler_shares_entries_between_normalized_inputs():
+    """
+    Test that inputs normalizing to the same value read the same cache entry.
+
+    Raises:
+        AssertionError: If equivalent inputs don't share their cached output.
+    """
+
+    cache_handler = CacheHandler()
+    cache_handler.register_normalizer(
+        "multiplier",
+        lambda input: ",".join(sorted(i.strip() for i in input.split(","))),
+    )
+    cache_handler.add("multiplier", "2,6", "12")
+
+    assert cache_handler.read("multiplier", "6, 2") == "12"
+    assert cache_handler.read("multiplier", "2,7") is None
+    assert cache_handler._cache == {("multiplier", "2,6"): "12"}
+
+
+def test_agent_aexecute_task(multiplier):
+    """
+    Test that independent tasks can be awaited together on the same agent.
+
+    Both take several steps, so a shared iteration count would force the answer of one.
+
+    Raises:
+        AssertionError: If either task doesn't return its own answer.
+    """
+
+    import asyncio
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        tools=[multiplier],
+        max_iter=5,
+        memory=False,
+        allow_delegation=False,
+    )
+
+    async def aplan(intermediate_steps, callbacks=None, **inputs):
+        # Let the other task take its step in between
+        await asyncio.sleep(0)
+        first = inputs["input"].split()[2]
+        if len(intermediate_steps) < 2:
+            second = len(intermediate_steps) + 2
+            return AgentAction("multiplier", f"{first},{second}", "")
+        observations = [str(observation) for _, observation in intermediate_steps]
+        return AgentFinish({"output": " ".join(observations)}, "")
+
+    async def execute_both():
+        return await asyncio.gather(
+            agent.aexecute_task("What is 3 times 4"),
+            agent.aexecute_task("What is 5 times 6"),
+        )
+
+    with patch.object(RunnableAgent, "aplan", side_effect=aplan):
+        outputs = asyncio.run(execute_both())
+
+    assert outputs == ["6 9", "10 15"]
+
+
+def test_cache_handler_persists_results_to_disk(tmp_path):
+    """
+    Test that tool results stored with a path are read back by another cache handler.
+
+    Raises:
+        AssertionError: If a persisted result isn't found by a fresh cache handler.
+    """
+
+    path = str(tmp_path / "tools.sqlite")
+    CacheHandler(path=path).add("multiplier", "2,6", 12)
+
+    cache_handler = CacheHandler(path=path)
+    assert cache_handler.read("multiplier", "2,6") == 12
+    assert cache_handler._cache == {("multiplier", "2,6"): 12}
+    assert cache_handler.read("multiplier", "3,3") is None
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """
+    Test that the disk cache evicts by order of use, even for accesses faster than the clock.
+
+    Raises:
+        AssertionError: If the wrong entry is evicted.
+    """
+
+    from crewai.agents.cache.disk_cache import DiskCache
+
+    disk = DiskCache(str(tmp_path / "tools.sqlite"), max_size=2)
+    # A clock standing still, every access happening within its resolution
+    with patch("time.time", return_value=1_700_000_000.0):
+        disk.add("multiplier", "2,6", 12)
+        disk.add("multiplier", "3,3", 9)
+        assert disk.read("multiplier", "2,6") == 12
+
+        disk.add("multiplier", "12,3", 36)
+
+        assert disk.read("multiplier", "3,3") is None
+        assert disk.read("multiplier", "2,6") == 12
+        assert disk.read("multiplier", "12,3") == 36
+
+
+def test_agent_scratchpad_keeps_latest_steps_within_budget():
+    """
+    Test that the oldest steps are dropped from the scratchpad once over the context budget.
+
+    Raises:
+        AssertionError: If the wrong steps are kept.
+    """
+
+    from langchain_core.agents import AgentAction
+    from langchain_openai import ChatOpenAI as OpenAI
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        context_budget_tokens=2,
+        allow_delegation=False,
+    )
+    steps = [
+        (AgentAction("multiplier", f"{i},2", f"step {i}"), str(i * 2)) for i in range(4)
+    ]
+
+    with patch.object(OpenAI, "get_num_tokens", return_value=1) as get_num_tokens:
+        scratchpad = agent._format_scratchpad(steps)
+        assert "step 0" not in scratchpad and "step 1" not in scratchpad
+        assert "step 2" in scratchpad and "step 3" in scratchpad
+        assert get_num_tokens.call_count == 3
+
+        # A new step is the only one tokenized on the next call
+        steps.append((AgentAction("multiplier", "4,2", "step 4"), "8"))
+        scratchpad = agent._format_scratchpad(steps)
+        assert "step 2" not in scratchpad
+        assert "step 3" in scratchpad and "step 4" in scratchpad
+        assert get_num_tokens.call_count == 4
+
+    agent.context_budget_tokens = None
+    assert "step 0" in agent._format_scratchpad(steps)
@@ -1,21 +1,44 @@
 """Test Agent creation and execution basic functionality."""
 
+from unittest.mock import patch
+
 import pytest
 
 from crewai.agent import Agent
 from crewai.tools.agent_tools import AgentTools
 
-researcher = Agent(
-    role="researcher",
-    goal="make the best research and analysis on content about AI and AI agents",
-    backstory="You're an expert researcher, specialized in technology",
-    allow_delegation=False,
-)
-tools = AgentTools(agents=[researcher])
+
+@pytest.fixture(scope="module")
+def researcher():
+    """
+    Researcher agent the tools delegate to, built once per module.
+
+    Returns:
+        Agent: The researcher agent.
+    """
+
+    return Agent(
+        role="researcher",
+        goal="make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology",
+        allow_delegation=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def tools(researcher):
+    """
+    Agent tools with the researcher as the only co-worker.
+
+    Returns:
+        AgentTools: The agent tools.
+    """
+
+    return AgentTools(agents=[researcher])
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_delegate_work():
+def test_delegate_work(tools):
     """
     Test the delegate_work function.
 
@@ -37,7 +60,7 @@ def test_delegate_work():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_ask_question():
+def test_ask_question(tools):
     """
     Test the ask_question function.
 
@@ -70,7 +93,7 @@ def test_can_not_self_delegate():
     pass
 
 
-def test_delegate_work_with_wrong_input():
+def test_delegate_work_with_wrong_input(tools):
     """
     Test if the delegate work with wrong input.
 
@@ -90,7 +113,7 @@ def test_delegate_work_with_wrong_input():
     )
 
 
-def test_delegate_work_to_wrong_agent():
+def test_delegate_work_to_wrong_agent(tools):
     """
     Test for delegating work to the wrong agent.
 
@@ -113,7 +136,7 @@ def test_delegate_work_to_wrong_agent():
     )
 
 
-def test_ask_question_to_wrong_agent():
+def test_ask_question_to_wrong_agent(tools):
     """
     Test for asking a question to the wrong agent.
 
@@ -134,3 +157,59 @@ def test_ask_question_to_wrong_agent():
         result
         == "\nError executing tool. Co-worker mentioned on the Action Input not found, it must to be one of the following options: researcher.\n"
     )
+
+
+def test_fuzzy_delegation_routes_to_closest_coworker(researcher):
+    """
+    Test that `fuzzy` routes a misspelled co-worker to the closest role, and still rejects unrelated ones.
+
+    Raises:
+        AssertionError: If the misspelled role isn't routed, or an unrelated one is.
+    """
+
+    agent_tools = AgentTools(agents=[researcher], fuzzy=True)
+
+    with patch.object(
+        Agent, "execute_task", return_value="AI agents are great"
+    ) as execute:
+        result = agent_tools.delegate_work(
+            command="Reseacher|share your take on AI Agents|I heard you hate them"
+        )
+
+    assert result == "AI agents are great"
+    execute.assert_called_once_with(
+        "share your take on AI Agents", "I heard you hate them"
+    )
+    assert (
+        agent_tools.ask_question(
+            command="writer|share your take on AI Agents|I heard you hate them"
+        )
+        == "\nError executing tool. Co-worker mentioned on the Action Input not found, it must to be one of the following options: researcher.\n"
+    )
+
+
+def test_tools_are_built_once_until_invalidated(researcher):
+    """
+    Test that the delegation tools are cached until `invalidate` is called.
+
+    Raises:
+        AssertionError: If the tools are rebuilt without invalidation or not refreshed after it.
+    """
+
+    agent_tools = AgentTools(agents=[researcher])
+    first = agent_tools.tools()
+
+    assert [t.name for t in first] == [t.name for t in agent_tools.tools()]
+    assert first[0] is agent_tools.tools()[0]
+
+    writer = Agent(
+        role="writer",
+        goal="write the best content about AI and AI agents",
+        backstory="You're a senior writer, specialized in technology",
+        allow_delegation=False,
+    )
+    agent_tools.agents.append(writer)
+    agent_tools.invalidate()
+
+    assert "researcher, writer" in agent_tools.tools()[0].description
+    assert first[0] is not agent_tools.tools()[0]
@@ -1,4 +1,78 @@
 # conftest.py
+import pytest
 from dotenv import load_dotenv
+from langchain_core.tools import tool
+
+from crewai import Agent
+from crewai.utilities import RPMController
 
 load_result = load_dotenv(override=True)
+
+
+@pytest.fixture(autouse=True)
+def no_rpm_sleep(monkeypatch):
+    """
+    Make the RPM controller return instead of sleeping, so no test waits on the rate limit.
+
+    Tests checking the throttling still patch `_wait_for_next_minute` themselves to assert on it.
+    """
+
+    monkeypatch.setattr(RPMController, "_wait_for_next_minute", lambda self: None)
+
+
+@pytest.fixture(scope="session")
+def multiplier():
+    """
+    Tool multiplying two numbers, built once per test session.
+
+    Returns:
+        BaseTool: The multiplier tool.
+    """
+
+    @tool
+    def multiplier(numbers) -> float:
+        """
+        Useful for when you need to multiply two numbers together.
+
+        Args:
+        numbers (str): A comma separated list of numbers of length two, representing the two numbers you want to multiply together.
+
+        Returns:
+        float: The result of multiplying the two input numbers together.
+        """
+        a, b = numbers.split(",")
+        return int(a) * int(b)
+
+    return multiplier
+
+
+@pytest.fixture(scope="session")
+def get_final_answer():
+    """
+    Tool that always answers 42, built once per test session.
+
+    Returns:
+        BaseTool: The get_final_answer tool.
+    """
+
+    @tool
+    def get_final_answer(numbers) -> float:
+        """
+        Get the final answer but don't give it yet, just re-use this
+        tool non-stop.
+        """
+        return 42
+
+    return get_final_answer
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """
+    Agent with the default settings, shared by the tests of a module that only inspect it.
+
+    Returns:
+        Agent: The agent.
+    """
+
+    return Agent(role="test role", goal="test goal", backstory="test backstory")
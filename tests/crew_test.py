@@ -11,26 +11,85 @@ from crewai.process import Process
 from crewai.task import Task
 from crewai.utilities import Logger, RPMController
 
-ceo = Agent(
-    role="CEO",
-    goal="Make sure the writers in your company produce amazing content.",
-    backstory="You're an long time CEO of a content creation agency with a Senior Writer on the team. You're now working on a new project and want to make sure the content produced is amazing.",
-    allow_delegation=True,
-)
-
-researcher = Agent(
-    role="Researcher",
-    goal="Make the best research and analysis on content about AI and AI agents",
-    backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
-    allow_delegation=False,
-)
-
-writer = Agent(
-    role="Senior Writer",
-    goal="Write the best content about AI and AI agents.",
-    backstory="You're a senior writer, specialized in technology, software engineering, AI and startups. You work as a freelancer and are now working on writing content for a new customer.",
-    allow_delegation=False,
-)
+# Two agents and their tasks, serialized once below for the string config tests
+_CONFIG = {
+    "agents": [
+        {
+            "role": "Senior Researcher",
+            "goal": "Make the best research and analysis on content about AI and AI agents",
+            "backstory": "You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        },
+        {
+            "role": "Senior Writer",
+            "goal": "Write the best content about AI and AI agents.",
+            "backstory": "You're a senior writer, specialized in technology, software engineering, AI and startups. You work as a freelancer and are now working on writing content for a new customer.",
+        },
+    ],
+    "tasks": [
+        {
+            "description": "Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+            "agent": "Senior Researcher",
+        },
+        {
+            "description": "Write a 1 amazing paragraph highlight for each idead that showcases how good an article about this topic could be, check references if necessary or search for more content but make sure it's unique, interesting and well written. Return the list of ideas with their paragraph and your notes.",
+            "agent": "Senior Writer",
+        },
+    ],
+}
+_CONFIG_JSON = json.dumps(_CONFIG)
+_NO_TASKS_CONFIG_JSON = json.dumps({"agents": _CONFIG["agents"][:1]})
+_NO_AGENTS_CONFIG_JSON = json.dumps({"tasks": _CONFIG["tasks"][:1]})
+
+
+@pytest.fixture(scope="module")
+def ceo():
+    """
+    CEO agent delegating to the writer, built once per module.
+
+    Returns:
+        Agent: The CEO agent.
+    """
+
+    return Agent(
+        role="CEO",
+        goal="Make sure the writers in your company produce amazing content.",
+        backstory="You're an long time CEO of a content creation agency with a Senior Writer on the team. You're now working on a new project and want to make sure the content produced is amazing.",
+        allow_delegation=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def researcher():
+    """
+    Researcher agent, built once per module.
+
+    Returns:
+        Agent: The researcher agent.
+    """
+
+    return Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def writer():
+    """
+    Senior writer agent, built once per module.
+
+    Returns:
+        Agent: The senior writer agent.
+    """
+
+    return Agent(
+        role="Senior Writer",
+        goal="Write the best content about AI and AI agents.",
+        backstory="You're a senior writer, specialized in technology, software engineering, AI and startups. You work as a freelancer and are now working on writing content for a new customer.",
+        allow_delegation=False,
+    )
 
 
 def test_crew_config_conditional_requirement():
@@ -47,47 +106,34 @@ def test_crew_config_conditional_requirement():
     with pytest.raises(ValueError):
         Crew(process=Process.sequential)
 
-    config = json.dumps(
-        {
-            "agents": [
-                {
-                    "role": "Senior Researcher",
-                    "goal": "Make the best research and analysis on content about AI and AI agents",
-                    "backstory": "You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
-                },
-                {
-                    "role": "Senior Writer",
-                    "goal": "Write the best content about AI and AI agents.",
-                    "backstory": "You're a senior writer, specialized in technology, software engineering, AI and startups. You work as a freelancer and are now working on writing content for a new customer.",
-                },
-            ],
-            "tasks": [
-                {
-                    "description": "Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
-                    "agent": "Senior Researcher",
-                },
-                {
-                    "description": "Write a 1 amazing paragraph highlight for each idead that showcases how good an article about this topic could be, check references if necessary or search for more content but make sure it's unique, interesting and well written. Return the list of ideas with their paragraph and your notes.",
-                    "agent": "Senior Writer",
-                },
-            ],
-        }
-    )
-    parsed_config = json.loads(config)
-
     try:
-        crew = Crew(process=Process.sequential, config=config)
+        crew = Crew(process=Process.sequential, config=_CONFIG_JSON)
     except ValueError:
         pytest.fail("Unexpected ValidationError raised")
 
     assert [agent.role for agent in crew.agents] == [
-        agent["role"] for agent in parsed_config["agents"]
+        agent["role"] for agent in _CONFIG["agents"]
     ]
     assert [task.description for task in crew.tasks] == [
-        task["description"] for task in parsed_config["tasks"]
+        task["description"] for task in _CONFIG["tasks"]
     ]
 
 
+def test_crew_config_dict_can_be_reused():
+    """
+    Test that building a crew from a dict config leaves the config untouched.
+
+    Raises:
+        AssertionError: If the config is consumed by the first crew.
+    """
+
+    for _ in range(2):
+        crew = Crew(process=Process.sequential, config=_CONFIG)
+        assert [task.agent.role for task in crew.tasks] == [
+            task["agent"] for task in _CONFIG["tasks"]
+        ]
+
+
 def test_crew_config_with_wrong_keys():
     """
     Test for crew configuration with wrong keys.
@@ -99,38 +145,16 @@ def test_crew_config_with_wrong_keys():
 
     """
 
-    no_tasks_config = json.dumps(
-        {
-            "agents": [
-                {
-                    "role": "Senior Researcher",
-                    "goal": "Make the best research and analysis on content about AI and AI agents",
-                    "backstory": "You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
-                }
-            ]
-        }
-    )
-
-    no_agents_config = json.dumps(
-        {
-            "tasks": [
-                {
-                    "description": "Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
-                    "agent": "Senior Researcher",
-                }
-            ]
-        }
-    )
     with pytest.raises(ValueError):
         Crew(process=Process.sequential, config='{"wrong_key": "wrong_value"}')
     with pytest.raises(ValueError):
-        Crew(process=Process.sequential, config=no_tasks_config)
+        Crew(process=Process.sequential, config=_NO_TASKS_CONFIG_JSON)
     with pytest.raises(ValueError):
-        Crew(process=Process.sequential, config=no_agents_config)
+        Crew(process=Process.sequential, config=_NO_AGENTS_CONFIG_JSON)
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_crew_creation():
+def test_crew_creation(researcher, writer):
     """
     Test the creation of a crew with tasks and agents.
 
@@ -173,7 +197,7 @@ def test_crew_creation():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_crew_with_delegating_agents():
+def test_crew_with_delegating_agents(ceo, writer):
     """
     Test the crew with delegating agents.
 
@@ -204,7 +228,7 @@ def test_crew_with_delegating_agents():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_crew_verbose_output(capsys):
+def test_crew_verbose_output(capsys, researcher, writer):
     """
     Test the verbose output of the Crew class.
 
@@ -246,15 +270,43 @@ def test_crew_verbose_output(capsys):
     for expected_string in expected_strings:
         assert expected_string in captured.out
 
-    # Now test with verbose set to False
-    crew._logger = Logger(verbose_level=False)
-    crew.kickoff()
+
+def test_crew_verbose_output_off(capsys, researcher, writer):
+    """
+    Test that a crew that isn't verbose doesn't log anything.
+
+    Only the crew's own logging is checked, so the agents' work is stubbed out.
+
+    Raises:
+        AssertionError: If anything is written to stdout.
+    """
+
+    from unittest.mock import patch
+
+    tasks = [
+        Task(description="Research AI advancements.", agent=researcher),
+        Task(description="Write about AI in healthcare.", agent=writer),
+    ]
+
+    crew = Crew(
+        agents=[researcher, writer],
+        tasks=tasks,
+        process=Process.sequential,
+        verbose=False,
+    )
+
+    with patch.object(
+        Agent, "execute_task", return_value="AI is advancing."
+    ) as execute:
+        crew.kickoff()
+
+    assert execute.call_count == 2
     captured = capsys.readouterr()
     assert captured.out == ""
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_crew_verbose_levels_output(capsys):
+def test_crew_verbose_levels_output(capsys, researcher):
     """
     Test the verbose levels output of the Crew class.
 
@@ -291,39 +343,20 @@ def test_crew_verbose_levels_output(capsys):
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
-def test_cache_hitting_between_agents():
-    """    Test cache hitting between agents.
+def test_cache_hitting_between_agents(multiplier, ceo, researcher):
+    """Test cache hitting between agents.
 
-        This function tests the cache hitting between agents by creating a
-        multiplier tool and using it to perform multiplication tasks for different
-        agents. It then checks if the cache is being utilized correctly.
+    This function tests the cache hitting between agents by creating a
+    multiplier tool and using it to perform multiplication tasks for different
+    agents. It then checks if the cache is being utilized correctly.
 
-        Raises:
-            AssertionError: If the cache is not being utilized correctly.
+    Raises:
+        AssertionError: If the cache is not being utilized correctly.
 
     """
 
     from unittest.mock import patch
 
-    from langchain.tools import tool
-
-    @tool
-    def multiplier(numbers) -> float:
-        """
-        Useful for when you need to multiply two numbers together.
-
-        Args:
-        - numbers (str): A comma separated list of numbers of length two, representing the two numbers you want to multiply together.
-
-        Returns:
-        - float: The result of multiplying the two input numbers together.
-
-        Raises:
-        - ValueError: If the input format is incorrect or if the input numbers are not valid integers.
-        """
-        a, b = numbers.split(",")
-        return int(a) * int(b)
-
     tasks = [
         Task(
             description="What is 2 tims 6? Return only the number.",
@@ -342,50 +375,139 @@ def test_cache_hitting_between_agents():
         tasks=tasks,
     )
 
+    original_read = CacheHandler.read
+    reads = []
+
+    def read(handler, tool, input):
+        result = original_read(handler, tool, input)
+        reads.append((tool, input, result))
+        return result
+
     assert crew._cache_handler._cache == {}
-    output = crew.kickoff()
-    assert crew._cache_handler._cache == {"multiplier-2,6": "12"}
+    with patch.object(
+        CacheHandler, "read", autospec=True, side_effect=read
+    ), patch.object(multiplier, "func", side_effect=multiplier.func) as multiply:
+        output = crew.kickoff()
+    assert crew._cache_handler._cache == {("multiplier", "2,6"): "12"}
     assert output == "12"
+    # The first agent misses and runs the tool, the second one reads its result
+    multiply.assert_called_once()
+    assert reads[0] == ("multiplier", "2,6", None)
+    assert ("multiplier", "2,6", "12") in reads[1:]
 
-    with patch.object(CacheHandler, "read") as read:
-        read.return_value = "12"
-        crew.kickoff()
-        read.assert_called_with("multiplier", "2,6")
 
+def test_crew_keeps_the_agents_own_cache_handler(tmp_path):
+    """
+    Test that a crew only gives its cache handler to the agents without their own.
 
-@pytest.mark.vcr(filter_headers=["authorization"])
-def test_api_calls_throttling(capsys):
-    """    Test the throttling of API calls.
+    Raises:
+        AssertionError: If an agent's own cache handler is replaced, or another agent doesn't get the crew's.
+    """
+
+    own_cache = CacheHandler(path=str(tmp_path / "tools.sqlite"))
+    own = Agent(
+        role="own",
+        goal="test goal",
+        backstory="test backstory",
+        cache_handler=own_cache,
+    )
+    shared = Agent(role="shared", goal="test goal", backstory="test backstory")
+    tasks = [
+        Task(description="first task", agent=own),
+        Task(description="second task", agent=shared),
+    ]
 
-        This function tests the throttling of API calls by simulating the usage of a tool to get the final answer without actually giving it. It creates an agent, a task, and a crew to carry out the test, and then uses a mock object to control the RPM (Revolutions Per Minute) and verify that the maximum RPM is reached.
+    crew = Crew(agents=[own, shared], tasks=tasks)
+    assert own.cache_handler is own_cache
+    assert own.tools_handler.cache is own_cache
+    assert shared.cache_handler is crew._cache_handler
 
-        Args:
-            capsys: A built-in pytest fixture for capturing stdout and stderr.
+    crew_cache = CacheHandler()
+    crew = Crew(agents=[own, shared], tasks=tasks, cache_handler=crew_cache)
+    assert own.cache_handler is own_cache
+    assert shared.cache_handler is crew_cache
+    assert shared.tools_handler.cache is crew_cache
 
-        Raises:
-            AssertionError: If the maximum RPM is not reached or if the expected message is not found in the captured output.
 
+def test_crew_keeps_the_normalizers_of_the_agents_cache_handler(multiplier):
+    """
+    Test that tool inputs are still normalized by the agent's cache handler once in a crew.
+
+    Raises:
+        AssertionError: If the result isn't cached under the normalized input.
     """
 
     from unittest.mock import patch
 
-    from langchain.tools import tool
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentAction, AgentFinish
 
-    @tool
-    def get_final_answer(numbers) -> float:
-        """
-        Get the final answer but don't give it yet, just re-use this tool non-stop.
+    cache_handler = CacheHandler()
+    cache_handler.register_normalizer(
+        "multiplier",
+        lambda input: ",".join(sorted(i.strip() for i in input.split(","))),
+    )
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        memory=False,
+        allow_delegation=False,
+        cache_handler=cache_handler,
+    )
+    task = Task(description="What is 6 times 2?", tools=[multiplier], agent=agent)
+    crew = Crew(agents=[agent], tasks=[task])
+
+    steps = [
+        AgentAction("multiplier", "6,2", "Action: multiplier\nAction Input: 6,2"),
+        AgentFinish({"output": "12"}, "Final Answer: 12"),
+    ]
+    with patch.object(RunnableAgent, "plan", side_effect=steps):
+        assert crew.kickoff() == "12"
+
+    assert cache_handler._cache == {("multiplier", "2,6"): "12"}
+    assert crew._cache_handler._cache == {}
 
-        Args:
-        - numbers: Input numbers
 
-        Returns:
-        - float: The final answer
+def test_crew_builds_delegation_tools_once_until_agents_change(ceo, researcher, writer):
+    """
+    Test that the crew keeps the same delegation tools for its tasks until its agents change.
+
+    Raises:
+        AssertionError: If the tools are rebuilt for an unchanged crew or kept after a change.
+    """
+
+    crew = Crew(
+        agents=[ceo, writer],
+        tasks=[Task(description="first task", agent=ceo)],
+    )
+    first = crew._delegation_tools()
+    assert first[0] is crew._delegation_tools()[0]
+    agent_tools = crew._agent_tools[1]
 
-        Raises:
-        - None
-        """
-        return 42
+    crew.agents.append(researcher)
+    tools = crew._delegation_tools()
+    assert crew._agent_tools[1] is agent_tools
+    assert agent_tools._find_agent("Researcher") is researcher
+    assert tools[0] is not first[0]
+    assert "CEO, Senior Writer, Researcher" in tools[0].description
+
+
+@pytest.mark.vcr(filter_headers=["authorization"])
+def test_api_calls_throttling(capsys, get_final_answer):
+    """Test the throttling of API calls.
+
+    This function tests the throttling of API calls by simulating the usage of a tool to get the final answer without actually giving it. It creates an agent, a task, and a crew to carry out the test, and then uses a mock object to control the RPM (Revolutions Per Minute) and verify that the maximum RPM is reached.
+
+    Args:
+        capsys: A built-in pytest fixture for capturing stdout and stderr.
+
+    Raises:
+        AssertionError: If the maximum RPM is not reached or if the expected message is not found in the captured output.
+
+    """
+
+    from unittest.mock import patch
 
     agent = Agent(
         role="test role",
@@ -408,5 +530,47 @@ def test_api_calls_throttling(capsys):
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached, waiting for the rate limit to refill." in captured.out
         moveon.assert_called()
+
+
+def test_crew_akickoff_passes_each_output_as_context():
+    """
+    Test that an asynchronously kicked off crew runs its tasks in order, chaining their outputs.
+
+    Raises:
+        AssertionError: If a task doesn't get the previous output as context or the final output is wrong.
+    """
+
+    import asyncio
+    from unittest.mock import patch
+
+    from langchain.agents.agent import RunnableAgent
+    from langchain_core.agents import AgentFinish
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        memory=False,
+        allow_delegation=False,
+    )
+    tasks = [
+        Task(description="first task", agent=agent),
+        Task(description="second task", agent=agent),
+    ]
+    crew = Crew(agents=[agent], tasks=tasks)
+
+    inputs = []
+
+    async def aplan(intermediate_steps, callbacks=None, **kwargs):
+        inputs.append(kwargs["input"])
+        return AgentFinish({"output": f"output {len(inputs)}"}, "")
+
+    with patch.object(RunnableAgent, "aplan", side_effect=aplan):
+        result = asyncio.run(crew.akickoff())
+
+    assert result == "output 2"
+    assert inputs[0] == "first task"
+    assert "second task" in inputs[1] and "output 1" in inputs[1]
+    assert tasks[0].output.result == "output 1"
@@ -1,32 +1,71 @@
 """Test Agent creation and execution basic functionality."""
 
+import pytest
+from langchain_core.tools import tool
 
 from crewai.agent import Agent
 from crewai.task import Task
+from crewai.tasks.task_output import TaskOutput
 
 
-def test_task_tool_reflect_agent_tools():
+@pytest.fixture(scope="module")
+def fake_tool():
     """
-    Test the reflection of tools in the task agent.
+    Tool given to the agent, never called.
 
-    This function tests the reflection of tools in the task agent by creating a fake tool and an agent, and then assigning the fake tool to the agent's tools. It then creates a task with a description and the agent, and asserts that the task's tools include the fake tool.
+    Returns:
+        BaseTool: The fake tool.
+    """
+
+    @tool
+    def fake_tool() -> None:
+        """
+        Fake tool
+
+        Raises:
+            No exceptions are raised.
+
+        Returns:
+            None
+        """
+
+    return fake_tool
 
-    Raises:
-        AssertionError: If the task's tools do not include the fake tool.
 
+@pytest.fixture(scope="module")
+def fake_task_tool():
     """
+    Tool given to the task, never called.
 
-    from langchain.tools import tool
+    Returns:
+        BaseTool: The fake task tool.
+    """
 
     @tool
-    def fake_tool() -> None:
+    def fake_task_tool() -> None:
         """
         Fake tool
 
-        Raises:
-            No specific exceptions are raised.
+        This function does not raise any exceptions.
+
+        Returns:
+            None
         """
 
+    return fake_task_tool
+
+
+def test_task_tool_reflect_agent_tools(fake_tool):
+    """
+    Test the reflection of tools in the task agent.
+
+    This function tests the reflection of tools in the task agent by creating a fake tool and an agent, and then assigning the fake tool to the agent's tools. It then creates a task with a description and the agent, and asserts that the task's tools include the fake tool.
+
+    Raises:
+        AssertionError: If the task's tools do not include the fake tool.
+
+    """
+
     researcher = Agent(
         role="Researcher",
         goal="Make the best research and analysis on content about AI and AI agents",
@@ -43,7 +82,7 @@ def test_task_tool_reflect_agent_tools():
     assert task.tools == [fake_tool]
 
 
-def test_task_tool_takes_precedence_ove_agent_tools():
+def test_task_tool_takes_precedence_ove_agent_tools(fake_tool, fake_task_tool):
     """
     Test that the task tool takes precedence over agent tools.
 
@@ -54,31 +93,6 @@ def test_task_tool_takes_precedence_ove_agent_tools():
 
     """
 
-    from langchain.tools import tool
-
-    @tool
-    def fake_tool() -> None:
-        """
-        Fake tool
-
-        Raises:
-            No exceptions are raised.
-
-        Returns:
-            None
-        """
-
-    @tool
-    def fake_task_tool() -> None:
-        """
-        Fake tool
-
-        This function does not raise any exceptions.
-
-        Returns:
-            None
-        """
-
     researcher = Agent(
         role="Researcher",
         goal="Make the best research and analysis on content about AI and AI agents",
@@ -95,3 +109,33 @@ def test_task_tool_takes_precedence_ove_agent_tools():
     )
 
     assert task.tools == [fake_task_tool]
+
+
+def test_task_output_dumps_its_summary():
+    """
+    Test that a task output, alone or as part of its task, is dumped with its summary.
+
+    Raises:
+        AssertionError: If the summary is missing from a dump.
+    """
+
+    import json
+
+    output = TaskOutput(
+        description="Give me a list of 5 interesting ideas to explore for an article",
+        result="1. AI agents",
+    )
+    expected = {
+        "description": "Give me a list of 5 interesting ideas to explore for an article",
+        "summary": "Give me a list of 5 interesting ideas to explore...",
+        "result": "1. AI agents",
+    }
+    assert output.model_dump() == expected
+    assert json.loads(output.model_dump_json()) == expected
+
+    task = Task(description=output.description)
+    assert task.model_dump()["output"] is None
+
+    task.output = output
+    assert task.model_dump()["output"] == expected
+    assert json.loads(task.model_dump_json())["output"] == expected
@@ -0,0 +1,76 @@
+"""Test loading and retrieving translations."""
+
+import pytest
+from pydantic import ValidationError
+
+from crewai.utilities import I18N, i18n
+
+
+def test_retrieve_missing_translation():
+    """
+    Test that retrieving a key missing from the translations raises a KeyError.
+
+    Raises:
+        AssertionError: If no KeyError naming the translation is raised.
+    """
+
+    with pytest.raises(KeyError, match="'errors':'missing_key'"):
+        I18N().errors("missing_key")
+
+
+def test_load_missing_translation_file(tmp_path, monkeypatch):
+    """
+    Test that loading a language without a translation file raises a ValueError.
+
+    Raises:
+        AssertionError: If no ValueError naming the language is raised.
+    """
+
+    monkeypatch.setattr(i18n, "_TRANSLATIONS_DIR", tmp_path)
+
+    with pytest.raises(ValueError, match="language 'xx' not found"):
+        i18n._load_translation("xx")
+
+
+def test_load_invalid_translation_file(tmp_path, monkeypatch):
+    """
+    Test that loading a translation file that isn't valid JSON raises a ValueError.
+
+    Raises:
+        AssertionError: If no ValueError is raised.
+    """
+
+    (tmp_path / "xx.json").write_text("{not json")
+    monkeypatch.setattr(i18n, "_TRANSLATIONS_DIR", tmp_path)
+
+    with pytest.raises(ValueError, match="Error decoding JSON"):
+        i18n._load_translation("xx")
+
+
+def test_unknown_language_is_rejected():
+    """
+    Test that a language without a translation file is rejected when creating the I18N.
+
+    Raises:
+        AssertionError: If the language is accepted.
+    """
+
+    with pytest.raises(ValidationError, match="language 'xx' not found"):
+        I18N(language="xx")
+
+
+def test_translations_are_loaded_on_first_use(monkeypatch):
+    """
+    Test that validating the language doesn't parse its translations until they are used.
+
+    Raises:
+        AssertionError: If the translations are parsed too early or not at all.
+    """
+
+    monkeypatch.setattr(i18n, "_TRANSLATIONS", {})
+
+    translator = I18N(language="el")
+    assert "el" not in i18n._TRANSLATIONS
+
+    translator.slice("observation")
+    assert "el" in i18n._TRANSLATIONS